@@ -0,0 +1,13 @@
+# orjson parses upstream response bodies several times faster than the
+# stdlib parser httpx uses by default; fall back transparently when it
+# is not installed.
+try:
+    import orjson
+
+    def loads_response(response):
+        """Parse an httpx response body into Python objects."""
+        return orjson.loads(response.content)
+except ImportError:
+    def loads_response(response):
+        """Parse an httpx response body into Python objects."""
+        return response.json()
@@ -1,17 +1,25 @@
+import asyncio
 import httpx
-import os
 from typing import List, Dict, Any, Optional
 
+from app.clients._json import loads_response
+from app.clients.http import acquire
+from app.config import get_settings
+
 class AutotaskClient:
     def __init__(self):
-        self.base_url = os.getenv("PSA_SERVICE_URL", "http://localhost:9030")
+        self.base_url = get_settings().psa_service_url
         self.autotask_endpoint = f"{self.base_url}/autotask"
-        self.timeout = httpx.Timeout(30.0)
+        self.timeout = httpx.Timeout(30.0, connect=5.0)
+
+    def _http_client(self):
+        """Process-wide pooled HTTP/2 client; stays open between calls."""
+        return acquire(self.timeout)
     
     async def get_statuses(self, msp_custom_domain: str) -> Dict[str, Any]:
         """Get all statuses for an MSP domain."""
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with self._http_client() as client:
                 response = await client.get(
                     f"{self.autotask_endpoint}/getStatuses",
                     params={"mspCustomDomain": msp_custom_domain}
@@ -19,7 +27,7 @@ class AutotaskClient:
                 if response.status_code == 200:
                     return {
                         "success": True,
-                        "statuses": response.json()
+                        "statuses": loads_response(response)
                     }
                 return {
                     "success": False,
@@ -35,7 +43,7 @@ class AutotaskClient:
     async def get_priorities(self, msp_custom_domain: str) -> Dict[str, Any]:
         """Get all priorities for an MSP domain."""
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with self._http_client() as client:
                 response = await client.get(
                     f"{self.autotask_endpoint}/getPriorities",
                     params={"mspCustomDomain": msp_custom_domain}
@@ -43,7 +51,7 @@ class AutotaskClient:
                 if response.status_code == 200:
                     return {
                         "success": True,
-                        "priorities": response.json()
+                        "priorities": loads_response(response)
                     }
                 return {
                     "success": False,
@@ -59,7 +67,7 @@ class AutotaskClient:
     async def get_issue_types(self, msp_custom_domain: str) -> Dict[str, Any]:
         """Get all issue types for an MSP domain."""
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with self._http_client() as client:
                 response = await client.get(
                     f"{self.autotask_endpoint}/getIssueTypes",
                     params={"mspCustomDomain": msp_custom_domain}
@@ -67,7 +75,7 @@ class AutotaskClient:
                 if response.status_code == 200:
                     return {
                         "success": True,
-                        "issue_types": response.json()
+                        "issue_types": loads_response(response)
                     }
                 return {
                     "success": False,
@@ -83,7 +91,7 @@ class AutotaskClient:
     async def get_ticket_categories(self, msp_custom_domain: str) -> Dict[str, Any]:
         """Get all ticket categories for an MSP domain."""
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with self._http_client() as client:
                 response = await client.get(
                     f"{self.autotask_endpoint}/getTicketCategories",
                     params={"mspCustomDomain": msp_custom_domain}
@@ -91,7 +99,7 @@ class AutotaskClient:
                 if response.status_code == 200:
                     return {
                         "success": True,
-                        "categories": response.json()
+                        "categories": loads_response(response)
                     }
                 return {
                     "success": False,
@@ -107,7 +115,7 @@ class AutotaskClient:
     async def get_ticket_types(self, msp_custom_domain: str) -> Dict[str, Any]:
         """Get all ticket types for an MSP domain."""
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with self._http_client() as client:
                 response = await client.get(
                     f"{self.autotask_endpoint}/getTicketTypes",
                     params={"mspCustomDomain": msp_custom_domain}
@@ -115,7 +123,7 @@ class AutotaskClient:
                 if response.status_code == 200:
                     return {
                         "success": True,
-                        "ticket_types": response.json()
+                        "ticket_types": loads_response(response)
                     }
                 return {
                     "success": False,
@@ -131,7 +139,7 @@ class AutotaskClient:
     async def get_queues(self, msp_custom_domain: str) -> Dict[str, Any]:
         """Get all queues for an MSP domain."""
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with self._http_client() as client:
                 response = await client.get(
                     f"{self.autotask_endpoint}/getQueues",
                     params={"mspCustomDomain": msp_custom_domain}
@@ -139,7 +147,7 @@ class AutotaskClient:
                 if response.status_code == 200:
                     return {
                         "success": True,
-                        "queues": response.json()
+                        "queues": loads_response(response)
                     }
                 return {
                     "success": False,
@@ -155,7 +163,7 @@ class AutotaskClient:
     async def get_queue_details(self, msp_custom_domain: str) -> Dict[str, Any]:
         """Get detailed queue information for an MSP domain."""
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with self._http_client() as client:
                 response = await client.get(
                     f"{self.autotask_endpoint}/getQueueDetails",
                     params={"mspCustomDomain": msp_custom_domain}
@@ -163,7 +171,7 @@ class AutotaskClient:
                 if response.status_code == 200:
                     return {
                         "success": True,
-                        "queue_details": response.json()
+                        "queue_details": loads_response(response)
                     }
                 return {
                     "success": False,
@@ -179,7 +187,7 @@ class AutotaskClient:
     async def get_sources(self, msp_custom_domain: str) -> Dict[str, Any]:
         """Get all sources for an MSP domain."""
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with self._http_client() as client:
                 response = await client.get(
                     f"{self.autotask_endpoint}/getSources",
                     params={"mspCustomDomain": msp_custom_domain}
@@ -187,7 +195,7 @@ class AutotaskClient:
                 if response.status_code == 200:
                     return {
                         "success": True,
-                        "sources": response.json()
+                        "sources": loads_response(response)
                     }
                 return {
                     "success": False,
@@ -203,7 +211,7 @@ class AutotaskClient:
     async def get_all_companies(self, msp_custom_domain: str) -> Dict[str, Any]:
         """Get all companies for an MSP domain."""
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with self._http_client() as client:
                 response = await client.get(
                     f"{self.autotask_endpoint}/getAllCompanies",
                     params={"mspCustomDomain": msp_custom_domain}
@@ -211,7 +219,7 @@ class AutotaskClient:
                 if response.status_code == 200:
                     return {
                         "success": True,
-                        "companies": response.json()
+                        "companies": loads_response(response)
                     }
                 return {
                     "success": False,
@@ -227,7 +235,7 @@ class AutotaskClient:
     async def get_all_contacts(self, msp_custom_domain: str) -> Dict[str, Any]:
         """Get all contacts for an MSP domain."""
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with self._http_client() as client:
                 response = await client.get(
                     f"{self.autotask_endpoint}/getAllContacts",
                     params={"mspCustomDomain": msp_custom_domain}
@@ -235,7 +243,7 @@ class AutotaskClient:
                 if response.status_code == 200:
                     return {
                         "success": True,
-                        "contacts": response.json()
+                        "contacts": loads_response(response)
                     }
                 return {
                     "success": False,
@@ -251,7 +259,7 @@ class AutotaskClient:
     async def get_all_resources(self, msp_custom_domain: str) -> Dict[str, Any]:
         """Get all resources for an MSP domain."""
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with self._http_client() as client:
                 response = await client.get(
                     f"{self.autotask_endpoint}/getAllResources",
                     params={"mspCustomDomain": msp_custom_domain}
@@ -259,7 +267,7 @@ class AutotaskClient:
                 if response.status_code == 200:
                     return {
                         "success": True,
-                        "resources": response.json()
+                        "resources": loads_response(response)
                     }
                 return {
                     "success": False,
@@ -272,10 +280,36 @@ class AutotaskClient:
                 "error": str(e)
             }
     
+
+    async def get_configuration(self, msp_custom_domain: str) -> Dict[str, Any]:
+        """Fetch queues and issue types concurrently and merge them locally.
+
+        Replaces the serial downstream mergeQueuesAndIssueTypes endpoint:
+        latency is max(t_queues, t_issue_types) instead of their sum.
+        """
+        queues_result, issue_types_result = await asyncio.gather(
+            self.get_queues(msp_custom_domain),
+            self.get_issue_types(msp_custom_domain)
+        )
+
+        if not queues_result.get("success"):
+            return queues_result
+        if not issue_types_result.get("success"):
+            return issue_types_result
+
+        return {
+            "success": True,
+            "configuration": {
+                "psaType": "Autotask",
+                "queues": queues_result.get("queues", []),
+                "issueTypes": issue_types_result.get("issue_types", [])
+            }
+        }
+
     async def merge_queues_and_issue_types(self, msp_custom_domain: str) -> Dict[str, Any]:
         """Get merged configuration of queues and issue types for an MSP domain."""
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with self._http_client() as client:
                 response = await client.get(
                     f"{self.autotask_endpoint}/mergeQueuesAndIssueTypes",
                     params={"mspCustomDomain": msp_custom_domain}
@@ -283,7 +317,7 @@ class AutotaskClient:
                 if response.status_code == 200:
                     return {
                         "success": True,
-                        "configuration": response.json()
+                        "configuration": loads_response(response)
                     }
                 return {
                     "success": False,
@@ -1,17 +1,24 @@
 import httpx
-import os
 from typing import List, Dict, Any, Optional
 
+from app.clients._json import loads_response
+from app.clients.http import acquire
+from app.config import get_settings
+
 class ConnectWiseClient:
     def __init__(self):
-        self.base_url = os.getenv("PSA_SERVICE_URL", "http://localhost:9030")
-        self.timeout = httpx.Timeout(30.0)
+        self.base_url = get_settings().psa_service_url
+        self.timeout = httpx.Timeout(30.0, connect=5.0)
+
+    def _http_client(self):
+        """Process-wide pooled HTTP/2 client; stays open between calls."""
+        return acquire(self.timeout)
         
     # Board Management
     async def create_board(self, board_request: Dict[str, Any], msp_custom_domain: str) -> Dict[str, Any]:
         """Create a new ConnectWise board"""
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with self._http_client() as client:
                 response = await client.post(
                     f"{self.base_url}/createConnectWiseBoard",
                     params={"mspCustomDomain": msp_custom_domain},
@@ -20,7 +27,7 @@ class ConnectWiseClient:
                 if response.status_code == 200:
                     return {
                         "success": True,
-                        "board": response.json()
+                        "board": loads_response(response)
                     }
                 return {
                     "success": False,
@@ -36,7 +43,7 @@ class ConnectWiseClient:
     async def get_boards(self, msp_custom_domain: str) -> Dict[str, Any]:
         """Get all ConnectWise boards"""
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with self._http_client() as client:
                 response = await client.get(
                     f"{self.base_url}/getConnectWiseBoards",
                     params={"mspCustomDomain": msp_custom_domain}
@@ -44,7 +51,7 @@ class ConnectWiseClient:
                 if response.status_code == 200:
                     return {
                         "success": True,
-                        "boards": response.json()
+                        "boards": loads_response(response)
                     }
                 return {
                     "success": False,
@@ -60,7 +67,7 @@ class ConnectWiseClient:
     async def get_statuses(self, board_id: int, msp_custom_domain: str) -> Dict[str, Any]:
         """Get statuses for a specific board"""
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with self._http_client() as client:
                 response = await client.get(
                     f"{self.base_url}/getConnectWiseStatuses",
                     params={
@@ -71,7 +78,7 @@ class ConnectWiseClient:
                 if response.status_code == 200:
                     return {
                         "success": True,
-                        "statuses": response.json()
+                        "statuses": loads_response(response)
                     }
                 return {
                     "success": False,
@@ -87,7 +94,7 @@ class ConnectWiseClient:
     async def get_clients(self, msp_custom_domain: str) -> Dict[str, Any]:
         """Get all ConnectWise clients"""
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with self._http_client() as client:
                 response = await client.get(
                     f"{self.base_url}/getConnectWiseClients",
                     params={"mspCustomDomain": msp_custom_domain}
@@ -95,7 +102,7 @@ class ConnectWiseClient:
                 if response.status_code == 200:
                     return {
                         "success": True,
-                        "clients": response.json()
+                        "clients": loads_response(response)
                     }
                 return {
                     "success": False,
@@ -111,7 +118,7 @@ class ConnectWiseClient:
     async def get_contacts(self, msp_custom_domain: str) -> Dict[str, Any]:
         """Get all ConnectWise contacts"""
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with self._http_client() as client:
                 response = await client.get(
                     f"{self.base_url}/getConnectWiseContacts",
                     params={"mspCustomDomain": msp_custom_domain}
@@ -119,7 +126,7 @@ class ConnectWiseClient:
                 if response.status_code == 200:
                     return {
                         "success": True,
-                        "contacts": response.json()
+                        "contacts": loads_response(response)
                     }
                 return {
                     "success": False,
@@ -135,7 +142,7 @@ class ConnectWiseClient:
     async def get_members(self, msp_custom_domain: str) -> Dict[str, Any]:
         """Get all ConnectWise members (technicians)"""
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with self._http_client() as client:
                 response = await client.get(
                     f"{self.base_url}/getConnectWiseMembers",
                     params={"mspCustomDomain": msp_custom_domain}
@@ -143,7 +150,7 @@ class ConnectWiseClient:
                 if response.status_code == 200:
                     return {
                         "success": True,
-                        "members": response.json()
+                        "members": loads_response(response)
                     }
                 return {
                     "success": False,
@@ -159,7 +166,7 @@ class ConnectWiseClient:
     async def get_departments(self, msp_custom_domain: str) -> Dict[str, Any]:
         """Get all ConnectWise departments"""
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with self._http_client() as client:
                 response = await client.get(
                     f"{self.base_url}/getConnectWiseDepartments",
                     params={"mspCustomDomain": msp_custom_domain}
@@ -167,7 +174,7 @@ class ConnectWiseClient:
                 if response.status_code == 200:
                     return {
                         "success": True,
-                        "departments": response.json()
+                        "departments": loads_response(response)
                     }
                 return {
                     "success": False,
@@ -183,7 +190,7 @@ class ConnectWiseClient:
     async def get_priorities(self, msp_custom_domain: str) -> Dict[str, Any]:
         """Get all ConnectWise priorities"""
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with self._http_client() as client:
                 response = await client.get(
                     f"{self.base_url}/getConnectWisePriorities",
                     params={"mspCustomDomain": msp_custom_domain}
@@ -191,7 +198,7 @@ class ConnectWiseClient:
                 if response.status_code == 200:
                     return {
                         "success": True,
-                        "priorities": response.json()
+                        "priorities": loads_response(response)
                     }
                 return {
                     "success": False,
@@ -207,7 +214,7 @@ class ConnectWiseClient:
     async def get_configuration(self, msp_custom_domain: str, board_id: int, board_name: str) -> Dict[str, Any]:
         """Get merged categorization configuration for a board"""
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with self._http_client() as client:
                 response = await client.get(
                     f"{self.base_url}/getMergedConnectWiseCategorizationWithoutImpactSeverity",
                     params={
@@ -219,7 +226,7 @@ class ConnectWiseClient:
                 if response.status_code == 200:
                     return {
                         "success": True,
-                        "configuration": response.json()
+                        "configuration": loads_response(response)
                     }
                 return {
                     "success": False,
@@ -235,7 +242,7 @@ class ConnectWiseClient:
     async def add_contact(self, msp_custom_domain: str, contact_data: Dict[str, Any]) -> Dict[str, Any]:
         """Add a new contact in ConnectWise"""
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with self._http_client() as client:
                 response = await client.post(
                     f"{self.base_url}/addConnectWiseContact",
                     params={"mspCustomDomain": msp_custom_domain},
@@ -244,7 +251,7 @@ class ConnectWiseClient:
                 if response.status_code == 200:
                     return {
                         "success": True,
-                        "contact": response.json()
+                        "contact": loads_response(response)
                     }
                 return {
                     "success": False,
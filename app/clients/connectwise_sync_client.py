@@ -1,11 +1,22 @@
 import httpx
-import os
 from typing import List, Dict, Any
 
+from app.clients._json import loads_response
+from app.clients.http import acquire
+from app.config import get_settings
+
 class ConnectWiseSyncClient:
     def __init__(self):
-        self.base_url = os.getenv("PSA_SERVICE_URL", "http://localhost:9030")
-        self.timeout = httpx.Timeout(60.0)  # Longer timeout for sync operations
+        self.base_url = get_settings().psa_service_url
+        self.timeout = httpx.Timeout(60.0, connect=5.0)  # Longer timeout for sync operations
+
+    def _http_client(self):
+        """Process-wide pooled HTTP/2 client; stays open between calls.
+
+        Uses the slow-traffic bound so long operations queue separately
+        from the fast lookup tools.
+        """
+        return acquire(self.timeout, kind="sync")
         
     async def sync_clients_contacts(self, msp_custom_domain: str) -> Dict[str, Any]:
         """
@@ -19,7 +30,7 @@ class ConnectWiseSyncClient:
             Dictionary with sync results or error information
         """
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with self._http_client() as client:
                 response = await client.get(
                     f"{self.base_url}/syncClientsContacts",
                     params={"mspCustomDomain": msp_custom_domain}
@@ -27,7 +38,7 @@ class ConnectWiseSyncClient:
                 if response.status_code == 200:
                     return {
                         "success": True,
-                        "sync_result": response.json(),
+                        "sync_result": loads_response(response),
                         "message": "Clients and contacts synced successfully"
                     }
                 return {
@@ -64,7 +75,7 @@ class ConnectWiseSyncClient:
             Dictionary with sync results or error information
         """
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with self._http_client() as client:
                 response = await client.post(
                     f"{self.base_url}/syncBoardTickets",
                     params={"mspCustomDomain": msp_custom_domain},
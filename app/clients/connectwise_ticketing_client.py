@@ -1,11 +1,22 @@
 import httpx
-import os
 from typing import Dict, Any, List, Optional
 
+from app.clients._json import loads_response
+from app.clients.http import acquire
+from app.config import get_settings
+
 class ConnectWiseTicketingClient:
     def __init__(self):
-        self.base_url = os.getenv("PSA_SERVICE_URL", "http://localhost:9030")
-        self.timeout = httpx.Timeout(30.0)
+        self.base_url = get_settings().psa_service_url
+        self.timeout = httpx.Timeout(30.0, connect=5.0)
+
+    def _http_client(self):
+        """Process-wide pooled HTTP/2 client; stays open between calls.
+
+        Uses the slow-traffic bound so long operations queue separately
+        from the fast lookup tools.
+        """
+        return acquire(self.timeout, kind="sync")
         
     async def get_ticket_categorization(self, msp_custom_domain: str, user_id: str, user_message: str) -> Dict[str, Any]:
         """
@@ -13,7 +24,7 @@ class ConnectWiseTicketingClient:
         Analyzes the message and suggests appropriate categories, priority, etc.
         """
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with self._http_client() as client:
                 response = await client.post(
                     f"{self.base_url}/getTicketCategorization",
                     json={
@@ -25,7 +36,7 @@ class ConnectWiseTicketingClient:
                 if response.status_code == 200:
                     return {
                         "success": True,
-                        "categorization": response.json()
+                        "categorization": loads_response(response)
                     }
                 return {
                     "success": False,
@@ -43,7 +54,7 @@ class ConnectWiseTicketingClient:
         Get ticket categorization with board-specific details.
         """
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with self._http_client() as client:
                 response = await client.post(
                     f"{self.base_url}/getTicketBoardCategorization",
                     json={
@@ -55,7 +66,7 @@ class ConnectWiseTicketingClient:
                 if response.status_code == 200:
                     return {
                         "success": True,
-                        "board_categorization": response.json()
+                        "board_categorization": loads_response(response)
                     }
                 return {
                     "success": False,
@@ -74,7 +85,7 @@ class ConnectWiseTicketingClient:
         Returns follow-up questions to better understand the issue.
         """
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with self._http_client() as client:
                 response = await client.post(
                     f"{self.base_url}/getTicketBoardCategorizationDiagnosticQandA",
                     json={
@@ -86,7 +97,7 @@ class ConnectWiseTicketingClient:
                 if response.status_code == 200:
                     return {
                         "success": True,
-                        "diagnostic_qa": response.json()
+                        "diagnostic_qa": loads_response(response)
                     }
                 return {
                     "success": False,
@@ -104,7 +115,7 @@ class ConnectWiseTicketingClient:
         Create a new ticket on a specific board.
         """
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with self._http_client() as client:
                 params = {"mspCustomDomain": msp_custom_domain}
                 if user_id:
                     params["userId"] = user_id
@@ -117,7 +128,7 @@ class ConnectWiseTicketingClient:
                 if response.status_code == 200:
                     return {
                         "success": True,
-                        "ticket": response.json()
+                        "ticket": loads_response(response)
                     }
                 return {
                     "success": False,
@@ -130,12 +141,80 @@ class ConnectWiseTicketingClient:
                 "error": str(e)
             }
     
+    async def categorize_and_create(self,
+                                    msp_custom_domain: str,
+                                    user_id: str,
+                                    issue_description: str,
+                                    company_id: int,
+                                    contact_id: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Run AI board categorization and ticket creation as one fused operation.
+        Both requests share a single HTTP connection, so the create call skips
+        a second connection handshake.
+        """
+        try:
+            async with self._http_client() as client:
+                response = await client.post(
+                    f"{self.base_url}/getTicketBoardCategorization",
+                    json={
+                        "mspCustomDomain": msp_custom_domain,
+                        "userId": user_id,
+                        "userMessage": issue_description
+                    }
+                )
+                if response.status_code != 200:
+                    return {
+                        "success": False,
+                        "error": f"Failed with status {response.status_code}",
+                        "message": response.text
+                    }
+
+                board_cat = loads_response(response)
+
+                # Build ticket details from AI suggestions
+                ticket_details = {
+                    "boardId": board_cat.get("boardId"),
+                    "summary": board_cat.get("summary", issue_description[:100]),
+                    "description": issue_description,
+                    "companyId": company_id
+                }
+                if contact_id:
+                    ticket_details["contactId"] = contact_id
+                for field in ("categoryId", "subcategoryId", "priorityId", "statusId"):
+                    if board_cat.get(field):
+                        ticket_details[field] = board_cat[field]
+
+                params = {"mspCustomDomain": msp_custom_domain}
+                if user_id:
+                    params["userId"] = user_id
+
+                create_response = await client.post(
+                    f"{self.base_url}/createBoardTicket",
+                    params=params,
+                    json=ticket_details
+                )
+                if create_response.status_code == 200:
+                    return {
+                        "success": True,
+                        "ticket": loads_response(create_response)
+                    }
+                return {
+                    "success": False,
+                    "error": f"Failed with status {create_response.status_code}",
+                    "message": create_response.text
+                }
+        except Exception as e:
+            return {
+                "success": False,
+                "error": str(e)
+            }
+
     async def update_ticket(self, msp_custom_domain: str, ticket_id: str, ticket_details: Dict[str, Any]) -> Dict[str, Any]:
         """
         Update an existing ticket.
         """
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with self._http_client() as client:
                 response = await client.put(
                     f"{self.base_url}/updateTicket/{ticket_id}",
                     params={"mspCustomDomain": msp_custom_domain},
@@ -144,7 +223,7 @@ class ConnectWiseTicketingClient:
                 if response.status_code == 200:
                     return {
                         "success": True,
-                        "updated_ticket": response.json()
+                        "updated_ticket": loads_response(response)
                     }
                 return {
                     "success": False,
@@ -162,7 +241,7 @@ class ConnectWiseTicketingClient:
         Get ticket details by ID.
         """
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with self._http_client() as client:
                 response = await client.get(
                     f"{self.base_url}/getTicketsById",
                     params={
@@ -173,7 +252,7 @@ class ConnectWiseTicketingClient:
                 if response.status_code == 200:
                     return {
                         "success": True,
-                        "ticket": response.json()
+                        "ticket": loads_response(response)
                     }
                 return {
                     "success": False,
@@ -192,7 +271,7 @@ class ConnectWiseTicketingClient:
         """
         try:
             endpoint = "/getConnectWiseTicketNotesById" if detailed else "/getTicketNotesById"
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with self._http_client() as client:
                 response = await client.get(
                     f"{self.base_url}{endpoint}",
                     params={
@@ -203,7 +282,7 @@ class ConnectWiseTicketingClient:
                 if response.status_code == 200:
                     return {
                         "success": True,
-                        "notes": response.json()
+                        "notes": loads_response(response)
                     }
                 return {
                     "success": False,
@@ -228,7 +307,7 @@ class ConnectWiseTicketingClient:
         Add a note to an existing ticket.
         """
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with self._http_client() as client:
                 response = await client.post(
                     f"{self.base_url}/addNoteToTicketObject",
                     params={
@@ -246,7 +325,7 @@ class ConnectWiseTicketingClient:
                 if response.status_code == 200:
                     return {
                         "success": True,
-                        "note": response.json()
+                        "note": loads_response(response)
                     }
                 return {
                     "success": False,
@@ -270,7 +349,7 @@ class ConnectWiseTicketingClient:
         Complete a ticket and update queue status.
         """
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with self._http_client() as client:
                 params = {
                     "mspCustomDomain": msp_custom_domain,
                     "ticketId": ticket_id,
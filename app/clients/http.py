@@ -0,0 +1,49 @@
+import asyncio
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from typing import Optional
+
+import httpx
+
+from app.config import get_settings
+
+# Every client proxies through the same PSA backend, so they share one
+# process-wide connection pool per timeout profile instead of each
+# keeping its own sockets and TLS sessions.
+
+@lru_cache(maxsize=None)
+def _shared_client(connect: Optional[float], read: Optional[float],
+                   write: Optional[float], pool: Optional[float]) -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(max_connections=200, max_keepalive_connections=50),
+        timeout=httpx.Timeout(connect=connect, read=read, write=write, pool=pool)
+    )
+
+def shared_client(timeout: httpx.Timeout) -> httpx.AsyncClient:
+    """Return the process-wide AsyncClient for a timeout profile."""
+    return _shared_client(timeout.connect, timeout.read, timeout.write, timeout.pool)
+
+# Fast lookups and minute-long sync/ticketing operations get separate
+# semaphores, so a batch of slow syncs cannot occupy every permit and
+# starve the quick reads queued behind them.
+@lru_cache(maxsize=None)
+def _request_semaphore(kind: str) -> asyncio.Semaphore:
+    """Cap on in-flight upstream requests for one traffic class."""
+    settings = get_settings()
+    if kind == "sync":
+        return asyncio.Semaphore(settings.max_sync_concurrency)
+    return asyncio.Semaphore(settings.max_concurrency)
+
+@asynccontextmanager
+async def acquire(timeout: httpx.Timeout, kind: str = "default"):
+    """Yield the shared client without closing it on exit.
+
+    Drop-in replacement for `async with httpx.AsyncClient(...)` blocks:
+    the pool outlives the block, so keep-alive connections stay warm
+    between tool calls. Entry also takes the traffic class's semaphore,
+    so a batch_execute fan-out cannot flood the upstream past the
+    configured concurrency bound.
+    """
+    async with _request_semaphore(kind):
+        yield shared_client(timeout)
@@ -1,12 +1,19 @@
 import httpx
-import os
 from typing import List, Dict
 
+from app.clients._json import loads_response
+from app.clients.http import acquire
+from app.config import get_settings
+
 class PSAClient:
     def __init__(self):
-        self.use_mock = os.getenv("USE_MOCK_DATA", "false").lower() == "true"
-        self.base_url = os.getenv("PSA_SERVICE_URL", "http://localhost:9030")
-        self.timeout = httpx.Timeout(30.0)
+        self.use_mock = get_settings().use_mock_data
+        self.base_url = get_settings().psa_service_url
+        self.timeout = httpx.Timeout(30.0, connect=5.0)
+
+    def _http_client(self):
+        """Process-wide pooled HTTP/2 client; stays open between calls."""
+        return acquire(self.timeout)
         
     async def get_tickets_by_domain(self, domain: str) -> List[Dict]:
         """Get tickets for a domain."""
@@ -34,14 +41,14 @@ class PSAClient:
         
         # Real API call
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with self._http_client() as client:
                 # Adjust the endpoint based on your actual PSA API
                 response = await client.get(
                     f"{self.base_url}/api/tickets",
                     params={"domain": domain}
                 )
                 response.raise_for_status()
-                return response.json()
+                return loads_response(response)
         except httpx.HTTPStatusError as e:
             return [{
                 "error": f"HTTP error: {e.response.status_code}",
@@ -1,12 +1,19 @@
 import httpx
-import os
 from typing import List, Dict, Any, Optional
 
+from app.clients._json import loads_response
+from app.clients.http import acquire
+from app.config import get_settings
+
 class PSAInitializationClient:
     def __init__(self):
-        self.base_url = os.getenv("PSA_SERVICE_URL", "http://localhost:9030")
+        self.base_url = get_settings().psa_service_url
         self.psa_endpoint = f"{self.base_url}/psa"
-        self.timeout = httpx.Timeout(30.0)
+        self.timeout = httpx.Timeout(30.0, connect=5.0)
+
+    def _http_client(self):
+        """Process-wide pooled HTTP/2 client; stays open between calls."""
+        return acquire(self.timeout)
         
     async def get_clients(self, msp_custom_domain: str) -> Dict[str, Any]:
         """
@@ -20,7 +27,7 @@ class PSAInitializationClient:
             Dictionary containing list of clients or error information
         """
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with self._http_client() as client:
                 response = await client.get(
                     f"{self.psa_endpoint}/getClients",
                     params={"mspCustomDomain": msp_custom_domain}
@@ -35,7 +42,7 @@ class PSAInitializationClient:
                 elif response.status_code == 200:
                     return {
                         "success": True,
-                        "clients": response.json()
+                        "clients": loads_response(response)
                     }
                 else:
                     return {
@@ -61,7 +68,7 @@ class PSAInitializationClient:
             Dictionary containing list of contacts or error information
         """
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with self._http_client() as client:
                 response = await client.get(
                     f"{self.psa_endpoint}/getContacts",
                     params={"mspCustomDomain": msp_custom_domain}
@@ -76,7 +83,7 @@ class PSAInitializationClient:
                 elif response.status_code == 200:
                     return {
                         "success": True,
-                        "contacts": response.json()
+                        "contacts": loads_response(response)
                     }
                 else:
                     return {
@@ -102,7 +109,7 @@ class PSAInitializationClient:
             Dictionary containing list of members or error information
         """
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with self._http_client() as client:
                 response = await client.get(
                     f"{self.psa_endpoint}/getMembers",
                     params={"mspCustomDomain": msp_custom_domain}
@@ -117,7 +124,7 @@ class PSAInitializationClient:
                 elif response.status_code == 200:
                     return {
                         "success": True,
-                        "members": response.json()
+                        "members": loads_response(response)
                     }
                 else:
                     return {
@@ -153,7 +160,7 @@ class PSAInitializationClient:
             Dictionary containing created contact or error information
         """
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with self._http_client() as client:
                 response = await client.post(
                     f"{self.psa_endpoint}/{msp_custom_domain}/addPSAContact",
                     json=contact_data
@@ -168,7 +175,7 @@ class PSAInitializationClient:
                 elif response.status_code == 200:
                     return {
                         "success": True,
-                        "contact": response.json()
+                        "contact": loads_response(response)
                     }
                 else:
                     return {
@@ -1,12 +1,22 @@
 import httpx
-import os
 from typing import Dict, Any
 
+from app.clients.http import acquire
+from app.config import get_settings
+
 class PSASyncClient:
     def __init__(self):
-        self.base_url = os.getenv("PSA_SERVICE_URL", "http://localhost:8080")
+        self.base_url = get_settings().psa_ticketing_url
         self.sync_endpoint = f"{self.base_url}/psa/sync"
-        self.timeout = httpx.Timeout(60.0)  # Longer timeout for sync operations
+        self.timeout = httpx.Timeout(60.0, connect=5.0)  # Longer timeout for sync operations
+
+    def _http_client(self):
+        """Process-wide pooled HTTP/2 client; stays open between calls.
+
+        Uses the slow-traffic bound so long operations queue separately
+        from the fast lookup tools.
+        """
+        return acquire(self.timeout, kind="sync")
         
     async def sync_tickets_for_domain(self, msp_custom_domain: str) -> Dict[str, Any]:
         """
@@ -20,7 +30,7 @@ class PSASyncClient:
             Dictionary with sync status or error information
         """
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with self._http_client() as client:
                 response = await client.post(
                     f"{self.sync_endpoint}/tickets",
                     params={"mspCustomDomain": msp_custom_domain}
@@ -69,7 +79,7 @@ class PSASyncClient:
             Dictionary with sync status or error information
         """
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with self._http_client() as client:
                 response = await client.post(f"{self.sync_endpoint}/all")
                 
                 if response.status_code == 200:
@@ -1,11 +1,22 @@
 import httpx
-import os
 from typing import Dict, Any, Optional
 
+from app.clients._json import loads_response
+from app.clients.http import acquire
+from app.config import get_settings
+
 class PSATicketingClient:
     def __init__(self):
-        self.base_url = os.getenv("PSA_SERVICE_URL", "http://localhost:8080")
-        self.timeout = httpx.Timeout(30.0)
+        self.base_url = get_settings().psa_ticketing_url
+        self.timeout = httpx.Timeout(30.0, connect=5.0)
+
+    def _http_client(self):
+        """Process-wide pooled HTTP/2 client; stays open between calls.
+
+        Uses the slow-traffic bound so long operations queue separately
+        from the fast lookup tools.
+        """
+        return acquire(self.timeout, kind="sync")
         
     async def get_ticket_diagnostic_qa(self, 
                                      msp_custom_domain: str, 
@@ -27,7 +38,7 @@ class PSATicketingClient:
             if tech_id:
                 request_body["techId"] = tech_id
                 
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with self._http_client() as client:
                 response = await client.post(
                     f"{self.base_url}/getTicketCategorizationDiagnosticQandA",
                     json=request_body
@@ -36,7 +47,7 @@ class PSATicketingClient:
                 if response.status_code == 200:
                     return {
                         "success": True,
-                        "diagnostic_qa": response.json()
+                        "diagnostic_qa": loads_response(response)
                     }
                 elif response.status_code == 400:
                     return {
@@ -64,7 +75,7 @@ class PSATicketingClient:
         Requires specific fields based on PSA type.
         """
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with self._http_client() as client:
                 response = await client.post(
                     f"{self.base_url}/createTicket",
                     params={"mspCustomDomain": msp_custom_domain},
@@ -74,7 +85,7 @@ class PSATicketingClient:
                 if response.status_code == 200:
                     return {
                         "success": True,
-                        "ticket": response.json()
+                        "ticket": loads_response(response)
                     }
                 elif response.status_code == 400:
                     return {
@@ -102,7 +113,7 @@ class PSATicketingClient:
         Add notes to an existing ticket.
         """
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with self._http_client() as client:
                 response = await client.post(
                     f"{self.base_url}/addNotesToTicket",
                     params={
@@ -115,7 +126,7 @@ class PSATicketingClient:
                 if response.status_code == 200:
                     return {
                         "success": True,
-                        "result": response.json()
+                        "result": loads_response(response)
                     }
                 elif response.status_code == 400:
                     return {
@@ -143,7 +154,7 @@ class PSATicketingClient:
         Get notes for a specific ticket.
         """
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with self._http_client() as client:
                 response = await client.get(
                     f"{self.base_url}/getTicketNotes",
                     params={
@@ -156,7 +167,7 @@ class PSATicketingClient:
                 if response.status_code == 200:
                     return {
                         "success": True,
-                        "notes": response.json()
+                        "notes": loads_response(response)
                     }
                 elif response.status_code == 404:
                     return {
@@ -191,7 +202,7 @@ class PSATicketingClient:
             if board_id is not None:
                 params["boardId"] = board_id
                 
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with self._http_client() as client:
                 response = await client.post(
                     f"{self.base_url}/closeTicket",
                     params=params
@@ -200,7 +211,7 @@ class PSATicketingClient:
                 if response.status_code == 200:
                     return {
                         "success": True,
-                        "result": response.json()
+                        "result": loads_response(response)
                     }
                 else:
                     return {
@@ -221,7 +232,7 @@ class PSATicketingClient:
         Get the current status of a ticket.
         """
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with self._http_client() as client:
                 response = await client.get(
                     f"{self.base_url}/getTicketStatus",
                     params={
@@ -233,7 +244,7 @@ class PSATicketingClient:
                 if response.status_code == 200:
                     return {
                         "success": True,
-                        "status": response.json()
+                        "status": loads_response(response)
                     }
                 elif response.status_code == 404:
                     return {
@@ -1,13 +1,24 @@
 import httpx
-import os
 from typing import Dict, Any, Optional
 from datetime import datetime
 
+from app.clients._json import loads_response
+from app.clients.http import acquire
+from app.config import get_settings
+
 class PSATimeEntryClient:
     def __init__(self):
-        self.base_url = os.getenv("PSA_SERVICE_URL", "http://localhost:8080")
+        self.base_url = get_settings().psa_ticketing_url
         self.api_endpoint = f"{self.base_url}/api/psa"
-        self.timeout = httpx.Timeout(30.0)
+        self.timeout = httpx.Timeout(30.0, connect=5.0)
+
+    def _http_client(self):
+        """Process-wide pooled HTTP/2 client; stays open between calls.
+
+        Uses the slow-traffic bound so long operations queue separately
+        from the fast lookup tools.
+        """
+        return acquire(self.timeout, kind="sync")
         
     async def create_time_entry(self, time_entry_request: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -27,21 +38,21 @@ class PSATimeEntryClient:
             Dictionary with time entry creation results
         """
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with self._http_client() as client:
                 response = await client.post(
                     f"{self.api_endpoint}/time-entries",
                     json=time_entry_request
                 )
                 
                 if response.status_code == 200:
-                    result = response.json()
+                    result = loads_response(response)
                     return {
                         "success": result.get("success", True),
                         "time_entry": result,
                         "message": "Time entry created successfully"
                     }
                 elif response.status_code == 500:
-                    error_data = response.json()
+                    error_data = loads_response(response)
                     return {
                         "success": False,
                         "error": error_data.get("error", "Time entry creation failed"),
@@ -67,11 +78,11 @@ class PSATimeEntryClient:
             Dictionary with service health information
         """
         try:
-            async with httpx.AsyncClient(timeout=httpx.Timeout(10.0)) as client:
+            async with acquire(httpx.Timeout(10.0)) as client:
                 response = await client.get(f"{self.api_endpoint}/health")
                 
                 if response.status_code == 200:
-                    health_data = response.json()
+                    health_data = loads_response(response)
                     return {
                         "success": True,
                         "healthy": health_data.get("status") == "UP",
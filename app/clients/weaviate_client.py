@@ -1,19 +1,24 @@
 import httpx
-import os
 from typing import Dict, Any, Optional
+
+from app.clients.http import acquire
+from app.config import get_settings
 import json
 
 class WeaviateClient:
     def __init__(self):
-        # Get base URL from environment or use default
-        self.base_url = os.getenv("PSA_SERVICE_URL", "http://localhost:9030")
+        self.base_url = get_settings().psa_service_url
         self.weaviate_endpoint = f"{self.base_url}/weaviate/test"
-        self.timeout = httpx.Timeout(30.0)
+        self.timeout = httpx.Timeout(30.0, connect=5.0)
+
+    def _http_client(self):
+        """Process-wide pooled HTTP/2 client; stays open between calls."""
+        return acquire(self.timeout)
         
     async def test_connection(self) -> Dict[str, Any]:
         """Test Weaviate connection through PSA service."""
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with self._http_client() as client:
                 response = await client.get(f"{self.weaviate_endpoint}/connection")
                 return {
                     "connected": response.status_code == 200,
@@ -30,7 +35,7 @@ class WeaviateClient:
     async def check_schema_exists(self) -> Dict[str, Any]:
         """Check if Weaviate schema exists."""
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with self._http_client() as client:
                 response = await client.get(f"{self.weaviate_endpoint}/schema/exists")
                 if response.status_code == 200:
                     # Parse the response to get boolean value
@@ -53,10 +58,22 @@ class WeaviateClient:
             }
     
     async def create_schema(self) -> Dict[str, Any]:
-        """Create Weaviate schema."""
+        """Create Weaviate schema. An already-existing schema counts as success."""
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with self._http_client() as client:
                 response = await client.post(f"{self.weaviate_endpoint}/schema/create")
+                # The service reports an existing schema as a conflict (or
+                # mentions it in the response body)
+                if response.status_code == 409 or (
+                    response.status_code == 200
+                    and "already exists" in response.text.lower()
+                ):
+                    return {
+                        "success": True,
+                        "status": "already_exists",
+                        "message": response.text,
+                        "status_code": response.status_code
+                    }
                 return {
                     "success": response.status_code == 200,
                     "message": response.text,
@@ -71,7 +88,7 @@ class WeaviateClient:
     async def delete_schema(self) -> Dict[str, Any]:
         """Delete Weaviate schema."""
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with self._http_client() as client:
                 response = await client.delete(f"{self.weaviate_endpoint}/schema/delete")
                 return {
                     "success": response.status_code == 200,
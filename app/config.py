@@ -0,0 +1,33 @@
+import os
+from dataclasses import dataclass
+from functools import lru_cache
+
+@dataclass(frozen=True, slots=True)
+class Settings:
+    """Immutable process configuration, resolved from the environment once.
+
+    Clients read attributes off this object instead of hitting os.environ
+    in every constructor, and the frozen dataclass guards against runtime
+    env mutation drifting the configuration mid-process.
+    """
+    psa_service_url: str     # main PSA service host (most clients)
+    psa_ticketing_url: str   # ticketing/sync/time-entry service host
+    use_mock_data: bool
+    max_concurrency: int      # cap on concurrent lookup/read requests
+    max_sync_concurrency: int  # separate cap for slow sync/ticketing calls
+
+    @classmethod
+    def from_env(cls) -> "Settings":
+        url = os.getenv("PSA_SERVICE_URL")
+        return cls(
+            psa_service_url=url or "http://localhost:9030",
+            psa_ticketing_url=url or "http://localhost:8080",
+            use_mock_data=os.getenv("USE_MOCK_DATA", "false").lower() == "true",
+            max_concurrency=int(os.getenv("PSA_MAX_CONCURRENCY", "20")),
+            max_sync_concurrency=int(os.getenv("PSA_SYNC_MAX_CONCURRENCY", "10")),
+        )
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Build the Settings singleton on first use (after load_dotenv runs)."""
+    return Settings.from_env()
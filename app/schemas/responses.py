@@ -0,0 +1,35 @@
+from pydantic import BaseModel, ConfigDict
+from typing import Optional
+
+# Typed result models for tools whose response shape is stable. A concrete
+# model lets FastMCP publish an output schema and reuse one compiled
+# serializer instead of walking an opaque dict per call. extra="allow"
+# keeps pass-through fields from the PSA service intact.
+
+class WeaviateConnectionStatus(BaseModel):
+    """Result of test_weaviate_connection."""
+    model_config = ConfigDict(extra="allow")
+
+    connected: bool
+    message: str
+    status_code: Optional[int] = None
+    error: Optional[str] = None
+
+class WeaviateSchemaCheck(BaseModel):
+    """Result of check_weaviate_schema."""
+    model_config = ConfigDict(extra="allow")
+
+    success: bool
+    schema_exists: Optional[bool] = None
+    raw_response: Optional[str] = None
+    error: Optional[str] = None
+
+class WeaviateSchemaOperation(BaseModel):
+    """Result of create_weaviate_schema / delete_weaviate_schema."""
+    model_config = ConfigDict(extra="allow")
+
+    success: bool
+    status: Optional[str] = None
+    message: Optional[str] = None
+    status_code: Optional[int] = None
+    error: Optional[str] = None
@@ -1,5 +1,5 @@
-from pydantic import BaseModel
-from typing import Optional
+from pydantic import BaseModel, TypeAdapter
+from typing import List, Optional
 from datetime import datetime
 
 class Ticket(BaseModel):
@@ -8,4 +8,19 @@ class Ticket(BaseModel):
     status: str
     priority: Optional[str] = None
     created_at: datetime
-    updated_at: datetime
\ No newline at end of file
+    updated_at: datetime
+
+# Compiled once so ticket lists are validated and dumped in single
+# pydantic-core passes instead of one model round-trip per ticket
+TICKET_LIST_ADAPTER = TypeAdapter(List[Ticket])
+
+def validate_ticket_list(raw_tickets: list) -> list:
+    """Validate and normalize a raw ticket list back to plain dicts.
+
+    Dumping in JSON mode yields primitives only, so callers can serialize
+    the result without another coercion pass per ticket.
+    """
+    return TICKET_LIST_ADAPTER.dump_python(
+        TICKET_LIST_ADAPTER.validate_python(raw_tickets),
+        mode="json"
+    )
@@ -1,8 +1,12 @@
 from typing import List
-from app.schemas.ticket import Ticket
+from app.schemas.ticket import validate_ticket_list
 from app.clients.psa_client import PSAClient
 from server import mcp
 
+# One client per module; repeated tool calls reuse its connection settings
+# instead of rebuilding them per invocation
+_psa_client = PSAClient()
+
 @mcp.tool
 async def get_tickets_by_domain(domain: str) -> List[dict]:
     """
@@ -14,10 +18,7 @@ async def get_tickets_by_domain(domain: str) -> List[dict]:
     Returns:
         List of tickets for the domain
     """
-    client = PSAClient()
-    raw_tickets = await client.get_tickets_by_domain(domain)
-    
-    # Convert to Ticket objects for validation, then back to dict
-    tickets = [Ticket(**ticket).model_dump() for ticket in raw_tickets]
-    
-    return tickets
\ No newline at end of file
+    raw_tickets = await _psa_client.get_tickets_by_domain(domain)
+
+    # Validate and normalize the whole batch in one TypeAdapter pass
+    return validate_ticket_list(raw_tickets)
\ No newline at end of file
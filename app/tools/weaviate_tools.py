@@ -2,6 +2,10 @@ from typing import Dict, Any
 from server import mcp
 from app.clients.weaviate_client import WeaviateClient
 
+# One client per module; repeated tool calls reuse its connection settings
+# instead of rebuilding them per invocation
+_weaviate_client = WeaviateClient()
+
 @mcp.tool
 async def test_weaviate_connection() -> Dict[str, Any]:
     """
@@ -10,8 +14,7 @@ async def test_weaviate_connection() -> Dict[str, Any]:
     Returns:
         Dictionary with connection status
     """
-    client = WeaviateClient()
-    connected = await client.test_connection()
+    connected = await _weaviate_client.test_connection()
     return {
         "connected": connected,
         "message": "Weaviate connection successful" if connected else "Failed to connect to Weaviate"
@@ -25,8 +28,7 @@ async def check_weaviate_schema() -> Dict[str, bool]:
     Returns:
         Dictionary indicating if schema exists
     """
-    client = WeaviateClient()
-    exists = await client.check_schema_exists()
+    exists = await _weaviate_client.check_schema_exists()
     return {"schema_exists": exists}
 
 @mcp.tool
@@ -37,14 +39,12 @@ async def create_weaviate_schema() -> Dict[str, str]:
     Returns:
         Dictionary with operation status
     """
-    client = WeaviateClient()
-    
     # Check if schema already exists
-    if await client.check_schema_exists():
+    if await _weaviate_client.check_schema_exists():
         return {"status": "exists", "message": "Schema already exists"}
     
     # Create schema
-    success = await client.create_schema()
+    success = await _weaviate_client.create_schema()
     return {
         "status": "created" if success else "failed",
         "message": "Schema created successfully" if success else "Failed to create schema"
@@ -58,8 +58,7 @@ async def delete_weaviate_schema() -> Dict[str, str]:
     Returns:
         Dictionary with operation status
     """
-    client = WeaviateClient()
-    success = await client.delete_schema()
+    success = await _weaviate_client.delete_schema()
     return {
         "status": "deleted" if success else "failed",
         "message": "Schema deleted successfully" if success else "Failed to delete schema"
@@ -1,22 +1,210 @@
+import asyncio
 import os
+import sys
+import time
+import uuid
+from contextlib import asynccontextmanager
 from dotenv import load_dotenv
 from fastmcp import FastMCP
-from typing import List, Dict, Any
-
-# Load environment variables
-load_dotenv()
+from functools import lru_cache, wraps
+from typing import List, Dict, Any, Optional
+
+# The server is pure async HTTP work, so a libuv-backed event loop speeds
+# up every await; fall back silently to the default loop when unavailable
+if sys.platform == "win32":
+    try:
+        import winloop
+        winloop.install()
+    except ImportError:
+        pass
+else:
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
+# orjson encodes large tool results (ticket/company/contact lists) several
+# times faster than stdlib json and emits bytes directly
+try:
+    import orjson
+
+    def _json_dumps(value: Any) -> str:
+        """Serialize a tool result to JSON text using orjson."""
+        return orjson.dumps(value).decode()
+except ImportError:
+    import json
+
+    def _json_dumps(value: Any) -> str:
+        """Serialize a tool result to JSON text using stdlib json."""
+        return json.dumps(value)
+
+async def _warm_upstreams() -> None:
+    """Open warm connections in the shared pool before serving.
+
+    Probes go through shared_client with the same timeout profile the
+    clients use, so the keep-alive sockets they open are the ones tool
+    calls reuse. Unreachable hosts are reported on stderr but never
+    block startup.
+    """
+    import httpx
+    from app.clients.http import shared_client
+    from app.config import get_settings
+
+    settings = get_settings()
+    # The two hosts are usually the same URL; the set keeps it to one probe
+    urls = sorted({settings.psa_service_url, settings.psa_ticketing_url})
+    client = shared_client(httpx.Timeout(30.0, connect=5.0))
+    results = await asyncio.gather(
+        *[client.get(url) for url in urls],
+        return_exceptions=True
+    )
+    for url, result in zip(urls, results):
+        if isinstance(result, Exception):
+            print(f"Warmup: {url} unreachable: {result}", file=sys.stderr)
+
+@asynccontextmanager
+async def _lifespan(server):
+    """Prebuild tool schemas and warm upstream connections before serving.
+
+    Running inside the serving event loop (not a separate pre-run loop)
+    means the warmed pool is the one the tools use; failures are never
+    fatal.
+    """
+    try:
+        await _prebuild_tool_schemas()
+    except Exception as e:
+        print(f"Schema prebuild skipped: {e}", file=sys.stderr)
+    try:
+        await _warm_upstreams()
+    except Exception as e:
+        print(f"Warmup skipped: {e}", file=sys.stderr)
+    yield
 
 # Create the MCP server
-mcp = FastMCP("Simple PSA Server")
+try:
+    mcp = FastMCP("Simple PSA Server", tool_serializer=_json_dumps,
+                  lifespan=_lifespan)
+except TypeError:
+    # Older fastmcp releases lack one of these hooks
+    try:
+        mcp = FastMCP("Simple PSA Server", lifespan=_lifespan)
+    except TypeError:
+        mcp = FastMCP("Simple PSA Server")
+
+# Registry of the raw tool coroutines, keyed by tool name. Used to dispatch
+# sub-calls in-process (see batch_execute) without re-entering the MCP layer.
+_TOOL_REGISTRY: Dict[str, Any] = {}
+
+# Per-tool latency samples in milliseconds, kept as fixed histogram
+# buckets so recording stays O(1) per call. Calls slower than the
+# threshold are reported on stderr as they happen.
+_SLOW_CALL_MS = 2000.0
+_LATENCY_BUCKETS_MS = (1.0, 5.0, 10.0, 25.0, 50.0, 100.0, 250.0,
+                       500.0, 1000.0, 2500.0, 5000.0, 10000.0)
+_LATENCY_BUCKET_LABELS = tuple(
+    f"<={int(bound)}ms" for bound in _LATENCY_BUCKETS_MS
+) + (f">{int(_LATENCY_BUCKETS_MS[-1])}ms",)
+_latency_stats: Dict[str, Dict[str, Any]] = {}
+
+def _record_latency(tool_name: str, elapsed_ms: float) -> None:
+    """Fold one call's duration into the tool's running histogram."""
+    stats = _latency_stats.get(tool_name)
+    if stats is None:
+        stats = _latency_stats[tool_name] = {
+            "count": 0,
+            "total_ms": 0.0,
+            "max_ms": 0.0,
+            "buckets": [0] * len(_LATENCY_BUCKET_LABELS)
+        }
+    stats["count"] += 1
+    stats["total_ms"] += elapsed_ms
+    if elapsed_ms > stats["max_ms"]:
+        stats["max_ms"] = elapsed_ms
+    for i, bound in enumerate(_LATENCY_BUCKETS_MS):
+        if elapsed_ms <= bound:
+            stats["buckets"][i] += 1
+            break
+    else:
+        stats["buckets"][-1] += 1
+
+    if elapsed_ms >= _SLOW_CALL_MS:
+        print(f"Slow tool call: {tool_name} took {elapsed_ms:.0f}ms",
+              file=sys.stderr)
+
+def mcp_tool(fn):
+    """Register a tool with FastMCP while keeping the raw coroutine callable.
+
+    Every registered tool is timed, so batch_execute sub-calls and direct
+    MCP invocations both feed the latency histograms.
+    """
+    @wraps(fn)
+    async def timed(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return await fn(*args, **kwargs)
+        finally:
+            _record_latency(fn.__name__,
+                            (time.perf_counter() - start) * 1000.0)
+
+    _TOOL_REGISTRY[fn.__name__] = timed
+    return mcp.tool(timed)
+
+# In-flight calls by (tool name, arguments). Concurrent identical calls
+# await the first caller's task instead of firing duplicate requests.
+_inflight: Dict[tuple, Any] = {}
+
+async def _single_flight(key: tuple, coro_factory):
+    """Coalesce concurrent identical requests onto one in-flight task."""
+    fut = _inflight.get(key)
+    if fut is None:
+        fut = asyncio.ensure_future(coro_factory())
+        _inflight[key] = fut
+        fut.add_done_callback(lambda _f: _inflight.pop(key, None))
+    return await fut
+
+def singleflight(fn):
+    """Coalesce concurrent calls with identical arguments onto one task.
+
+    Only suitable for idempotent read tools: every concurrent caller gets
+    the same result object.
+    """
+    @wraps(fn)
+    async def wrapper(*args, **kwargs):
+        key = (fn.__name__, args, tuple(sorted(kwargs.items())))
+        return await _single_flight(key, lambda: fn(*args, **kwargs))
+    return wrapper
 
 # Import dependencies
-from app.schemas.ticket import Ticket
+from app.schemas.ticket import validate_ticket_list
+from app.schemas.responses import (
+    WeaviateConnectionStatus,
+    WeaviateSchemaCheck,
+    WeaviateSchemaOperation,
+)
 from app.clients.psa_client import PSAClient
 from app.clients.weaviate_client import WeaviateClient
 
+# Ticket batches above this size are validated in a worker thread so the
+# event loop keeps servicing other tool calls in the meantime
+_VALIDATE_IN_THREAD_THRESHOLD = 100
+
+# Client singletons. Each getter builds its client on first use and reuses
+# the same instance for every subsequent tool call, so connection settings
+# are resolved once instead of per invocation.
+
+@lru_cache(maxsize=1)
+def _psa_client() -> PSAClient:
+    return PSAClient()
+
+@lru_cache(maxsize=1)
+def _weaviate_client() -> WeaviateClient:
+    return WeaviateClient()
+
 # ========== Ticket Tools ==========
 
-@mcp.tool
+@mcp_tool
+@singleflight
 async def get_tickets_by_domain(domain: str) -> List[dict]:
     """
     Get support tickets for a given domain.
@@ -27,349 +215,470 @@ async def get_tickets_by_domain(domain: str) -> List[dict]:
     Returns:
         List of tickets for the domain
     """
-    client = PSAClient()
+    client = _psa_client()
     raw_tickets = await client.get_tickets_by_domain(domain)
-    
-    # Convert to Ticket objects for validation, then back to dict
-    tickets = [Ticket(**ticket).model_dump() for ticket in raw_tickets]
-    
+
+    # Large batches go through a worker thread; small payloads skip the
+    # thread-pool hand-off overhead
+    if len(raw_tickets) > _VALIDATE_IN_THREAD_THRESHOLD:
+        tickets = await asyncio.to_thread(validate_ticket_list, raw_tickets)
+    else:
+        tickets = validate_ticket_list(raw_tickets)
+
     return tickets
 
 # ========== Weaviate Tools ==========
 
-@mcp.tool
-async def test_weaviate_connection() -> Dict[str, Any]:
+# Once the schema is known to exist, create_weaviate_schema returns
+# without a remote call for this long. The lock keeps concurrent callers
+# from firing duplicate create requests on a cold cache.
+_SCHEMA_EXISTS_TTL_SECONDS = 300.0
+_schema_exists_until = 0.0
+_schema_check_lock = asyncio.Lock()
+
+@mcp_tool
+async def test_weaviate_connection() -> WeaviateConnectionStatus:
     """
     Test the connection to Weaviate database through PSA service.
     
     Returns:
         Dictionary with connection status and details
     """
-    client = WeaviateClient()
+    client = _weaviate_client()
     return await client.test_connection()
 
-@mcp.tool
-async def check_weaviate_schema() -> Dict[str, Any]:
+@mcp_tool
+@singleflight
+async def check_weaviate_schema() -> WeaviateSchemaCheck:
     """
     Check if the Weaviate schema exists in the PSA service.
     
     Returns:
         Dictionary with schema existence status
     """
-    client = WeaviateClient()
+    client = _weaviate_client()
     return await client.check_schema_exists()
 
-@mcp.tool
-async def create_weaviate_schema() -> Dict[str, Any]:
+@mcp_tool
+async def create_weaviate_schema() -> WeaviateSchemaOperation:
     """
     Create the Weaviate schema through PSA service if it doesn't exist.
     
     Returns:
         Dictionary with operation status and message
     """
-    client = WeaviateClient()
-    
-    # First check if schema exists
-    check_result = await client.check_schema_exists()
-    if check_result.get("success") and check_result.get("schema_exists"):
+    global _schema_exists_until
+
+    client = _weaviate_client()
+
+    # A fresh positive check means there is nothing to create
+    if time.monotonic() < _schema_exists_until:
         return {
             "success": True,
             "status": "already_exists",
             "message": "Schema already exists"
         }
-    
-    # Create schema
-    return await client.create_schema()
 
-@mcp.tool
-async def delete_weaviate_schema() -> Dict[str, Any]:
+    async with _schema_check_lock:
+        # Another caller may have refreshed the cache while we waited
+        if time.monotonic() < _schema_exists_until:
+            return {
+                "success": True,
+                "status": "already_exists",
+                "message": "Schema already exists"
+            }
+
+        # The create endpoint is idempotent (an existing schema comes back
+        # as already_exists), so call it directly instead of paying a
+        # separate existence round-trip first
+        result = await client.create_schema()
+        if result.get("success"):
+            _schema_exists_until = time.monotonic() + _SCHEMA_EXISTS_TTL_SECONDS
+        return result
+
+@mcp_tool
+async def delete_weaviate_schema() -> WeaviateSchemaOperation:
     """
     Delete the Weaviate schema from PSA service (use with caution).
     
     Returns:
         Dictionary with operation status and message
     """
-    client = WeaviateClient()
-    return await client.delete_schema()
+    global _schema_exists_until
+
+    client = _weaviate_client()
+    result = await client.delete_schema()
+    # The cached existence check is stale after a delete
+    _schema_exists_until = 0.0
+    return result
 # ========== Autotask Tools ==========
 
 from app.clients.autotask_client import AutotaskClient
 
-@mcp.tool
-async def get_autotask_statuses(msp_custom_domain: str) -> Dict[str, Any]:
-    """
-    Get all ticket statuses from Autotask for an MSP domain.
-    
-    Args:
-        msp_custom_domain: The MSP custom domain (e.g., 'etech7')
-        
-    Returns:
-        Dictionary containing list of statuses or error information
-    """
-    client = AutotaskClient()
-    return await client.get_statuses(msp_custom_domain)
+@lru_cache(maxsize=1)
+def _autotask_client() -> AutotaskClient:
+    return AutotaskClient()
 
-@mcp.tool
-async def get_autotask_priorities(msp_custom_domain: str) -> Dict[str, Any]:
+@mcp_tool
+@singleflight
+async def get_autotask_configuration(msp_custom_domain: str) -> Dict[str, Any]:
     """
-    Get all ticket priorities from Autotask for an MSP domain.
+    Get merged configuration of queues and issue types from Autotask for an MSP domain.
+    This provides a complete ticketing configuration including PSA type.
     
     Args:
         msp_custom_domain: The MSP custom domain (e.g., 'etech7')
         
     Returns:
-        Dictionary containing list of priorities or error information
+        Dictionary containing PSA ticketing configuration or error information
     """
-    client = AutotaskClient()
-    return await client.get_priorities(msp_custom_domain)
+    client = _autotask_client()
+    return await client.get_configuration(msp_custom_domain)
 
-@mcp.tool
-async def get_autotask_issue_types(msp_custom_domain: str) -> Dict[str, Any]:
-    """
-    Get all issue types from Autotask for an MSP domain.
-    
-    Args:
-        msp_custom_domain: The MSP custom domain (e.g., 'etech7')
-        
-    Returns:
-        Dictionary containing list of issue types or error information
-    """
-    client = AutotaskClient()
-    return await client.get_issue_types(msp_custom_domain)
+# Add this import after your other client imports
+from app.clients.connectwise_client import ConnectWiseClient
 
-@mcp.tool
-async def get_autotask_ticket_categories(msp_custom_domain: str) -> Dict[str, Any]:
-    """
-    Get all ticket categories from Autotask for an MSP domain.
-    
-    Args:
-        msp_custom_domain: The MSP custom domain (e.g., 'etech7')
-        
-    Returns:
-        Dictionary containing list of ticket categories or error information
-    """
-    client = AutotaskClient()
-    return await client.get_ticket_categories(msp_custom_domain)
+@lru_cache(maxsize=1)
+def _connectwise_client() -> ConnectWiseClient:
+    return ConnectWiseClient()
+
+# ========== Simple Lookup Tool Factory ==========
+# The Autotask and ConnectWise lookup tools all share the same shape: take
+# an MSP domain, call one client method, and return its dict. They are
+# generated from the spec tables below so every wrapper stays identical.
+
+# Successful lookups for reference data (statuses, queues, ...) are cached
+# per domain for this long. Per-key locks keep a cold key from firing
+# duplicate upstream fetches when callers race. Very low-churn tables
+# (departments, priorities) get the slow TTL.
+_LOOKUP_CACHE_TTL_SECONDS = 300.0
+_LOOKUP_CACHE_SLOW_TTL_SECONDS = 3600.0
+_lookup_cache: Dict[tuple, tuple] = {}
+_lookup_locks: Dict[tuple, asyncio.Lock] = {}
+
+def _invalidate_lookup_cache(prefix: str, msp_custom_domain: str) -> int:
+    """Drop cached lookups for a domain whose tool name starts with prefix."""
+    stale = [key for key in _lookup_cache
+             if key[0].startswith(prefix) and key[1] == msp_custom_domain]
+    for key in stale:
+        _lookup_cache.pop(key, None)
+    return len(stale)
+
+def _make_simple_tool(name: str, client_getter, method_name: str,
+                      description: str, returns: str,
+                      cache_ttl: float = 0.0):
+    if cache_ttl > 0:
+        async def _tool(msp_custom_domain: str) -> Dict[str, Any]:
+            key = (name, msp_custom_domain)
+            cached = _lookup_cache.get(key)
+            if cached is not None and time.monotonic() < cached[0]:
+                return cached[1]
+            lock = _lookup_locks.setdefault(key, asyncio.Lock())
+            async with lock:
+                # Another caller may have populated the key while we waited
+                cached = _lookup_cache.get(key)
+                if cached is not None and time.monotonic() < cached[0]:
+                    return cached[1]
+                client = client_getter()
+                result = await getattr(client, method_name)(msp_custom_domain)
+                if result.get("success"):
+                    _lookup_cache[key] = (time.monotonic() + cache_ttl, result)
+                return result
+    else:
+        async def _tool(msp_custom_domain: str) -> Dict[str, Any]:
+            client = client_getter()
+            return await _single_flight(
+                (name, msp_custom_domain),
+                lambda: getattr(client, method_name)(msp_custom_domain)
+            )
 
-@mcp.tool
-async def get_autotask_ticket_types(msp_custom_domain: str) -> Dict[str, Any]:
-    """
-    Get all ticket types from Autotask for an MSP domain.
-    
-    Args:
-        msp_custom_domain: The MSP custom domain (e.g., 'etech7')
-        
-    Returns:
-        Dictionary containing list of ticket types or error information
-    """
-    client = AutotaskClient()
-    return await client.get_ticket_types(msp_custom_domain)
+    _tool.__name__ = name
+    _tool.__qualname__ = name
+    _tool.__doc__ = (
+        f"\n    {description}\n\n"
+        "    Args:\n"
+        "        msp_custom_domain: The MSP custom domain (e.g., 'etech7')\n\n"
+        "    Returns:\n"
+        f"        Dictionary containing {returns} or error information\n    "
+    )
+    return _tool
+
+# (tool name, client method, description, returned data, cache TTL seconds)
+# Enumeration-style reference data gets a TTL; entity lists that churn
+# (companies, contacts, members, resources) stay uncached.
+_AUTOTASK_SIMPLE_TOOLS = (
+    ("get_autotask_statuses", "get_statuses",
+     "Get all ticket statuses from Autotask for an MSP domain.", "list of statuses", _LOOKUP_CACHE_TTL_SECONDS),
+    ("get_autotask_priorities", "get_priorities",
+     "Get all ticket priorities from Autotask for an MSP domain.", "list of priorities", _LOOKUP_CACHE_TTL_SECONDS),
+    ("get_autotask_issue_types", "get_issue_types",
+     "Get all issue types from Autotask for an MSP domain.", "list of issue types", _LOOKUP_CACHE_TTL_SECONDS),
+    ("get_autotask_ticket_categories", "get_ticket_categories",
+     "Get all ticket categories from Autotask for an MSP domain.", "list of ticket categories", _LOOKUP_CACHE_TTL_SECONDS),
+    ("get_autotask_ticket_types", "get_ticket_types",
+     "Get all ticket types from Autotask for an MSP domain.", "list of ticket types", _LOOKUP_CACHE_TTL_SECONDS),
+    ("get_autotask_queues", "get_queues",
+     "Get all queues from Autotask for an MSP domain.", "list of queues", _LOOKUP_CACHE_TTL_SECONDS),
+    ("get_autotask_queue_details", "get_queue_details",
+     "Get detailed queue information from Autotask for an MSP domain.", "detailed queue information", _LOOKUP_CACHE_TTL_SECONDS),
+    ("get_autotask_sources", "get_sources",
+     "Get all ticket sources from Autotask for an MSP domain.", "list of sources", _LOOKUP_CACHE_TTL_SECONDS),
+    ("get_autotask_companies", "get_all_companies",
+     "Get all companies from Autotask for an MSP domain.", "list of companies", 0.0),
+    ("get_autotask_contacts", "get_all_contacts",
+     "Get all contacts from Autotask for an MSP domain.", "list of contacts", 0.0),
+    ("get_autotask_resources", "get_all_resources",
+     "Get all resources (technicians/employees) from Autotask for an MSP domain.", "list of resources", 0.0),
+)
+
+_CONNECTWISE_SIMPLE_TOOLS = (
+    ("get_connectwise_boards", "get_boards",
+     "Get all boards from ConnectWise for an MSP domain. "
+     "Boards are used to organize tickets by type (e.g., Service Board, Project Board).",
+     "list of boards", _LOOKUP_CACHE_TTL_SECONDS),
+    ("get_connectwise_clients", "get_clients",
+     "Get all clients/companies from ConnectWise for an MSP domain.", "list of clients", 0.0),
+    ("get_connectwise_contacts", "get_contacts",
+     "Get all contacts from ConnectWise for an MSP domain.", "list of contacts", 0.0),
+    ("get_connectwise_members", "get_members",
+     "Get all members (technicians/employees) from ConnectWise for an MSP domain.", "list of members", 0.0),
+    ("get_connectwise_departments", "get_departments",
+     "Get all departments from ConnectWise for an MSP domain.", "list of departments", _LOOKUP_CACHE_SLOW_TTL_SECONDS),
+    ("get_connectwise_priorities", "get_priorities",
+     "Get all ticket priorities from ConnectWise for an MSP domain.", "list of priorities", _LOOKUP_CACHE_SLOW_TTL_SECONDS),
+)
+
+for _name, _method, _description, _returns, _ttl in _AUTOTASK_SIMPLE_TOOLS:
+    globals()[_name] = mcp_tool(
+        _make_simple_tool(_name, _autotask_client, _method, _description, _returns,
+                          cache_ttl=_ttl)
+    )
 
-@mcp.tool
-async def get_autotask_queues(msp_custom_domain: str) -> Dict[str, Any]:
-    """
-    Get all queues from Autotask for an MSP domain.
-    
-    Args:
-        msp_custom_domain: The MSP custom domain (e.g., 'etech7')
-        
-    Returns:
-        Dictionary containing list of queues or error information
-    """
-    client = AutotaskClient()
-    return await client.get_queues(msp_custom_domain)
+for _name, _method, _description, _returns, _ttl in _CONNECTWISE_SIMPLE_TOOLS:
+    globals()[_name] = mcp_tool(
+        _make_simple_tool(_name, _connectwise_client, _method, _description, _returns,
+                          cache_ttl=_ttl)
+    )
 
-@mcp.tool
-async def get_autotask_queue_details(msp_custom_domain: str) -> Dict[str, Any]:
+@mcp_tool
+async def invalidate_autotask_cache(msp_custom_domain: str) -> Dict[str, Any]:
     """
-    Get detailed queue information from Autotask for an MSP domain.
-    
-    Args:
-        msp_custom_domain: The MSP custom domain (e.g., 'etech7')
-        
-    Returns:
-        Dictionary containing detailed queue information or error information
-    """
-    client = AutotaskClient()
-    return await client.get_queue_details(msp_custom_domain)
+    Drop cached Autotask lookup results for an MSP domain.
+    Use after Autotask configuration changes so the next lookup re-fetches.
 
-@mcp.tool
-async def get_autotask_sources(msp_custom_domain: str) -> Dict[str, Any]:
-    """
-    Get all ticket sources from Autotask for an MSP domain.
-    
     Args:
         msp_custom_domain: The MSP custom domain (e.g., 'etech7')
-        
-    Returns:
-        Dictionary containing list of sources or error information
-    """
-    client = AutotaskClient()
-    return await client.get_sources(msp_custom_domain)
 
-@mcp.tool
-async def get_autotask_companies(msp_custom_domain: str) -> Dict[str, Any]:
-    """
-    Get all companies from Autotask for an MSP domain.
-    
-    Args:
-        msp_custom_domain: The MSP custom domain (e.g., 'etech7')
-        
     Returns:
-        Dictionary containing list of companies or error information
+        Dictionary with the number of cache entries invalidated
     """
-    client = AutotaskClient()
-    return await client.get_all_companies(msp_custom_domain)
+    dropped = _invalidate_lookup_cache("get_autotask_", msp_custom_domain)
+    return {
+        "success": True,
+        "invalidated_entries": dropped
+    }
 
-@mcp.tool
-async def get_autotask_contacts(msp_custom_domain: str) -> Dict[str, Any]:
+@mcp_tool
+async def invalidate_connectwise_cache(msp_custom_domain: str) -> Dict[str, Any]:
     """
-    Get all contacts from Autotask for an MSP domain.
-    
-    Args:
-        msp_custom_domain: The MSP custom domain (e.g., 'etech7')
-        
-    Returns:
-        Dictionary containing list of contacts or error information
-    """
-    client = AutotaskClient()
-    return await client.get_all_contacts(msp_custom_domain)
+    Drop cached ConnectWise lookup results for an MSP domain.
+    Use after ConnectWise configuration changes (e.g. creating a board)
+    so the next lookup re-fetches.
 
-@mcp.tool
-async def get_autotask_resources(msp_custom_domain: str) -> Dict[str, Any]:
-    """
-    Get all resources (technicians/employees) from Autotask for an MSP domain.
-    
     Args:
         msp_custom_domain: The MSP custom domain (e.g., 'etech7')
-        
+
     Returns:
-        Dictionary containing list of resources or error information
+        Dictionary with the number of cache entries invalidated
     """
-    client = AutotaskClient()
-    return await client.get_all_resources(msp_custom_domain)
+    dropped = _invalidate_lookup_cache("get_connectwise_", msp_custom_domain)
+    return {
+        "success": True,
+        "invalidated_entries": dropped
+    }
 
-@mcp.tool
-async def get_autotask_configuration(msp_custom_domain: str) -> Dict[str, Any]:
+@mcp_tool
+async def purge_cache(msp_custom_domain: str) -> Dict[str, Any]:
     """
-    Get merged configuration of queues and issue types from Autotask for an MSP domain.
-    This provides a complete ticketing configuration including PSA type.
-    
+    Drop every cached lookup result for an MSP domain, across all PSA types.
+
     Args:
         msp_custom_domain: The MSP custom domain (e.g., 'etech7')
-        
+
     Returns:
-        Dictionary containing PSA ticketing configuration or error information
+        Dictionary with the number of cache entries invalidated
     """
-    client = AutotaskClient()
-    return await client.merge_queues_and_issue_types(msp_custom_domain)
+    dropped = _invalidate_lookup_cache("", msp_custom_domain)
+    return {
+        "success": True,
+        "invalidated_entries": dropped
+    }
 
-# Add this import after your other client imports
-from app.clients.connectwise_client import ConnectWiseClient
+async def _bootstrap_lookups(client, methods: tuple, msp_custom_domain: str) -> Dict[str, Any]:
+    """Run a table of (key, method) lookups concurrently and zip the results."""
+    results = await asyncio.gather(
+        *[getattr(client, method)(msp_custom_domain) for _, method in methods],
+        return_exceptions=True
+    )
+    lookups = {}
+    for (key, _), result in zip(methods, results):
+        if isinstance(result, Exception):
+            result = {"success": False, "error": str(result)}
+        lookups[key] = result
+    return {
+        "success": all(r.get("success") for r in lookups.values()),
+        "lookups": lookups
+    }
 
-# ========== ConnectWise Tools ==========
+_AUTOTASK_BOOTSTRAP_METHODS = (
+    ("statuses", "get_statuses"),
+    ("priorities", "get_priorities"),
+    ("issue_types", "get_issue_types"),
+    ("ticket_categories", "get_ticket_categories"),
+    ("ticket_types", "get_ticket_types"),
+    ("queues", "get_queues"),
+    ("sources", "get_sources"),
+    ("companies", "get_all_companies"),
+    ("contacts", "get_all_contacts"),
+    ("resources", "get_all_resources"),
+)
+
+_CONNECTWISE_BOOTSTRAP_METHODS = (
+    ("boards", "get_boards"),
+    ("clients", "get_clients"),
+    ("contacts", "get_contacts"),
+    ("members", "get_members"),
+    ("departments", "get_departments"),
+    ("priorities", "get_priorities"),
+)
+
+@mcp_tool
+@singleflight
+async def get_autotask_bootstrap(msp_custom_domain: str) -> Dict[str, Any]:
+    """
+    Fetch all Autotask reference data for an MSP domain in one call.
+    Runs the ten individual lookups concurrently, replacing ten sequential
+    tool round-trips when an agent bootstraps its state.
 
-@mcp.tool
-async def get_connectwise_boards(msp_custom_domain: str) -> Dict[str, Any]:
-    """
-    Get all boards from ConnectWise for an MSP domain.
-    Boards are used to organize tickets by type (e.g., Service Board, Project Board).
-    
     Args:
         msp_custom_domain: The MSP custom domain (e.g., 'etech7')
-        
-    Returns:
-        Dictionary containing list of boards or error information
-    """
-    client = ConnectWiseClient()
-    return await client.get_boards(msp_custom_domain)
 
-@mcp.tool
-async def get_connectwise_board_statuses(msp_custom_domain: str, board_id: int) -> Dict[str, Any]:
-    """
-    Get all statuses for a specific ConnectWise board.
-    
-    Args:
-        msp_custom_domain: The MSP custom domain (e.g., 'etech7')
-        board_id: The ID of the board
-        
     Returns:
-        Dictionary containing list of statuses or error information
+        Dictionary with a 'lookups' map keyed by data type, each entry
+        holding that lookup's result or error information
     """
-    client = ConnectWiseClient()
-    return await client.get_statuses(board_id, msp_custom_domain)
+    return await _bootstrap_lookups(
+        _autotask_client(), _AUTOTASK_BOOTSTRAP_METHODS, msp_custom_domain
+    )
 
-@mcp.tool
-async def get_connectwise_clients(msp_custom_domain: str) -> Dict[str, Any]:
-    """
-    Get all clients/companies from ConnectWise for an MSP domain.
-    
-    Args:
-        msp_custom_domain: The MSP custom domain (e.g., 'etech7')
-        
-    Returns:
-        Dictionary containing list of clients or error information
+@mcp_tool
+@singleflight
+async def get_connectwise_bootstrap(msp_custom_domain: str) -> Dict[str, Any]:
     """
-    client = ConnectWiseClient()
-    return await client.get_clients(msp_custom_domain)
+    Fetch all ConnectWise reference data for an MSP domain in one call.
+    Runs the six individual lookups concurrently, replacing six sequential
+    tool round-trips when an agent bootstraps its state.
 
-@mcp.tool
-async def get_connectwise_contacts(msp_custom_domain: str) -> Dict[str, Any]:
-    """
-    Get all contacts from ConnectWise for an MSP domain.
-    
     Args:
         msp_custom_domain: The MSP custom domain (e.g., 'etech7')
-        
-    Returns:
-        Dictionary containing list of contacts or error information
-    """
-    client = ConnectWiseClient()
-    return await client.get_contacts(msp_custom_domain)
 
-@mcp.tool
-async def get_connectwise_members(msp_custom_domain: str) -> Dict[str, Any]:
-    """
-    Get all members (technicians/employees) from ConnectWise for an MSP domain.
-    
-    Args:
-        msp_custom_domain: The MSP custom domain (e.g., 'etech7')
-        
     Returns:
-        Dictionary containing list of members or error information
+        Dictionary with a 'lookups' map keyed by data type, each entry
+        holding that lookup's result or error information
     """
-    client = ConnectWiseClient()
-    return await client.get_members(msp_custom_domain)
+    return await _bootstrap_lookups(
+        _connectwise_client(), _CONNECTWISE_BOOTSTRAP_METHODS, msp_custom_domain
+    )
 
-@mcp.tool
-async def get_connectwise_departments(msp_custom_domain: str) -> Dict[str, Any]:
-    """
-    Get all departments from ConnectWise for an MSP domain.
-    
-    Args:
-        msp_custom_domain: The MSP custom domain (e.g., 'etech7')
-        
-    Returns:
-        Dictionary containing list of departments or error information
-    """
-    client = ConnectWiseClient()
-    return await client.get_departments(msp_custom_domain)
+# The stdio transport has no streaming, so the bulk list tools get paged
+# variants instead: the full upstream result is cached briefly per domain
+# and sliced locally, so an agent walking all pages pays for one fetch.
+_PAGE_CACHE_TTL_SECONDS = 60.0
+
+# (tool name, client getter, client method, result key, description)
+_PAGED_TOOLS = (
+    ("get_autotask_companies_page", _autotask_client, "get_all_companies",
+     "companies", "Get one page of Autotask companies for an MSP domain."),
+    ("get_autotask_contacts_page", _autotask_client, "get_all_contacts",
+     "contacts", "Get one page of Autotask contacts for an MSP domain."),
+    ("get_autotask_resources_page", _autotask_client, "get_all_resources",
+     "resources", "Get one page of Autotask resources for an MSP domain."),
+    ("get_connectwise_clients_page", _connectwise_client, "get_clients",
+     "clients", "Get one page of ConnectWise clients for an MSP domain."),
+    ("get_connectwise_contacts_page", _connectwise_client, "get_contacts",
+     "contacts", "Get one page of ConnectWise contacts for an MSP domain."),
+    ("get_connectwise_members_page", _connectwise_client, "get_members",
+     "members", "Get one page of ConnectWise members for an MSP domain."),
+)
+
+def _make_paged_tool(name: str, client_getter, method_name: str,
+                     items_key: str, description: str):
+    async def _tool(msp_custom_domain: str, limit: int = 500,
+                    offset: int = 0) -> Dict[str, Any]:
+        key = (name, msp_custom_domain)
+        cached = _lookup_cache.get(key)
+        if cached is not None and time.monotonic() < cached[0]:
+            result = cached[1]
+        else:
+            client = client_getter()
+            result = await _single_flight(
+                key, lambda: getattr(client, method_name)(msp_custom_domain)
+            )
+            if result.get("success"):
+                _lookup_cache[key] = (
+                    time.monotonic() + _PAGE_CACHE_TTL_SECONDS, result
+                )
+        if not result.get("success"):
+            return result
+
+        items = result.get(items_key, [])
+        return {
+            "success": True,
+            items_key: items[offset:offset + limit],
+            "total": len(items),
+            "offset": offset,
+            "limit": limit,
+            "has_more": offset + limit < len(items)
+        }
+
+    _tool.__name__ = name
+    _tool.__qualname__ = name
+    _tool.__doc__ = (
+        f"\n    {description}\n"
+        "    The full list is fetched once and cached briefly, so walking\n"
+        "    every page costs a single upstream request.\n\n"
+        "    Args:\n"
+        "        msp_custom_domain: The MSP custom domain (e.g., 'etech7')\n"
+        "        limit: Maximum number of items per page (default: 500)\n"
+        "        offset: Number of items to skip (default: 0)\n\n"
+        "    Returns:\n"
+        f"        Dictionary containing the requested page of {items_key},\n"
+        "        total count, paging fields, or error information\n    "
+    )
+    return _tool
+
+for _spec in _PAGED_TOOLS:
+    globals()[_spec[0]] = mcp_tool(_make_paged_tool(*_spec))
 
-@mcp.tool
-async def get_connectwise_priorities(msp_custom_domain: str) -> Dict[str, Any]:
+
+# ========== ConnectWise Tools ==========
+
+@mcp_tool
+async def get_connectwise_board_statuses(msp_custom_domain: str, board_id: int) -> Dict[str, Any]:
     """
-    Get all ticket priorities from ConnectWise for an MSP domain.
+    Get all statuses for a specific ConnectWise board.
     
     Args:
         msp_custom_domain: The MSP custom domain (e.g., 'etech7')
+        board_id: The ID of the board
         
     Returns:
-        Dictionary containing list of priorities or error information
+        Dictionary containing list of statuses or error information
     """
-    client = ConnectWiseClient()
-    return await client.get_priorities(msp_custom_domain)
+    client = _connectwise_client()
+    return await client.get_statuses(board_id, msp_custom_domain)
 
-@mcp.tool
+@mcp_tool
 async def get_connectwise_board_configuration(msp_custom_domain: str, board_id: int, board_name: str) -> Dict[str, Any]:
     """
     Get the complete configuration for a ConnectWise board including categories and subcategories.
@@ -382,10 +691,10 @@ async def get_connectwise_board_configuration(msp_custom_domain: str, board_id:
     Returns:
         Dictionary containing board configuration or error information
     """
-    client = ConnectWiseClient()
+    client = _connectwise_client()
     return await client.get_configuration(msp_custom_domain, board_id, board_name)
 
-@mcp.tool
+@mcp_tool
 async def create_connectwise_board(msp_custom_domain: str, board_name: str, board_type: str = "Service") -> Dict[str, Any]:
     """
     Create a new board in ConnectWise.
@@ -398,14 +707,18 @@ async def create_connectwise_board(msp_custom_domain: str, board_name: str, boar
     Returns:
         Dictionary containing created board information or error
     """
-    client = ConnectWiseClient()
+    client = _connectwise_client()
     board_request = {
         "name": board_name,
         "type": board_type
     }
-    return await client.create_board(board_request, msp_custom_domain)
+    result = await client.create_board(board_request, msp_custom_domain)
+    if result.get("success"):
+        # The cached board list is stale once a board is added
+        _invalidate_lookup_cache("get_connectwise_boards", msp_custom_domain)
+    return result
 
-@mcp.tool
+@mcp_tool
 async def add_connectwise_contact(
     msp_custom_domain: str,
     first_name: str,
@@ -430,27 +743,56 @@ async def add_connectwise_contact(
     Returns:
         Dictionary containing created contact information or error
     """
-    client = ConnectWiseClient()
+    client = _connectwise_client()
     contact_data = {
         "firstName": first_name,
         "lastName": last_name,
         "email": email,
         "companyId": company_id
     }
-    
-    if phone_number:
-        contact_data["phoneNumber"] = phone_number
-    if title:
-        contact_data["title"] = title
-        
+    # Empty-string optionals stay omitted, as the original branches did
+    contact_data.update({key: value for key, value in (
+        ("phoneNumber", phone_number),
+        ("title", title)
+    ) if value})
     return await client.add_contact(msp_custom_domain, contact_data)
 
 # Add this import after your other client imports
 from app.clients.connectwise_sync_client import ConnectWiseSyncClient
 
+@lru_cache(maxsize=1)
+def _cw_sync_client() -> ConnectWiseSyncClient:
+    return ConnectWiseSyncClient()
+
 # ========== ConnectWise Sync Tools ==========
 
-@mcp.tool
+# Maps tool-facing board config keys to the downstream API's field names
+_BOARD_KEY_MAP = (
+    ("board_id", "boardId"),
+    ("board_name", "boardName"),
+    ("sync_from_date", "syncFromDate"),
+    ("sync_statuses", "syncStatus")
+)
+
+async def _sync_boards_impl(
+    msp_custom_domain: str,
+    board_configs: List[Dict[str, Any]]
+) -> Dict[str, Any]:
+    """
+    Translate board configs to the downstream format and dispatch one batched
+    sync request. Shared by the public tool and internal composition so the
+    latter skips the MCP tool layer.
+    """
+    client = _cw_sync_client()
+
+    board_sync_requests = [
+        {dst: config[src] for src, dst in _BOARD_KEY_MAP if config.get(src) is not None}
+        for config in board_configs
+    ]
+
+    return await client.sync_board_tickets(msp_custom_domain, board_sync_requests)
+
+@mcp_tool
 async def sync_connectwise_clients_contacts(msp_custom_domain: str) -> Dict[str, Any]:
     """
     Synchronize all clients and contacts from ConnectWise to local database.
@@ -462,10 +804,10 @@ async def sync_connectwise_clients_contacts(msp_custom_domain: str) -> Dict[str,
     Returns:
         Dictionary containing sync results or error information
     """
-    client = ConnectWiseSyncClient()
+    client = _cw_sync_client()
     return await client.sync_clients_contacts(msp_custom_domain)
 
-@mcp.tool
+@mcp_tool
 async def sync_connectwise_board_tickets(
     msp_custom_domain: str,
     board_id: int,
@@ -487,7 +829,7 @@ async def sync_connectwise_board_tickets(
     Returns:
         Dictionary containing sync results or error information
     """
-    client = ConnectWiseSyncClient()
+    client = _cw_sync_client()
     
     # Build board sync request
     board_sync_request = {
@@ -503,7 +845,7 @@ async def sync_connectwise_board_tickets(
     
     return await client.sync_board_tickets(msp_custom_domain, [board_sync_request])
 
-@mcp.tool
+@mcp_tool
 async def sync_multiple_connectwise_boards(
     msp_custom_domain: str,
     board_configs: List[Dict[str, Any]]
@@ -537,27 +879,9 @@ async def sync_multiple_connectwise_boards(
             }
         ]
     """
-    client = ConnectWiseSyncClient()
-    
-    # Transform the input format to match API expectations
-    board_sync_requests = []
-    for config in board_configs:
-        request = {
-            "boardId": config.get("board_id"),
-            "boardName": config.get("board_name")
-        }
-        
-        if "sync_from_date" in config:
-            request["syncFromDate"] = config["sync_from_date"]
-            
-        if "sync_statuses" in config:
-            request["syncStatus"] = config["sync_statuses"]
-            
-        board_sync_requests.append(request)
-    
-    return await client.sync_board_tickets(msp_custom_domain, board_sync_requests)
+    return await _sync_boards_impl(msp_custom_domain, board_configs)
 
-@mcp.tool
+@mcp_tool
 async def sync_all_connectwise_data(msp_custom_domain: str) -> Dict[str, Any]:
     """
     Perform a complete synchronization of all ConnectWise data.
@@ -577,21 +901,29 @@ async def sync_all_connectwise_data(msp_custom_domain: str) -> Dict[str, Any]:
         "errors": []
     }
     
-    # First, sync clients and contacts
-    sync_client = ConnectWiseSyncClient()
-    cw_client = ConnectWiseClient()  # Reuse existing client
-    
-    # Sync clients and contacts
-    clients_result = await sync_client.sync_clients_contacts(msp_custom_domain)
+    # Use the shared cached clients rather than constructing fresh ones
+    sync_client = _cw_sync_client()
+    cw_client = _connectwise_client()
+
+    # The clients/contacts sync and the boards fetch are independent remote
+    # operations, so run them concurrently
+    clients_result, boards_result = await asyncio.gather(
+        sync_client.sync_clients_contacts(msp_custom_domain),
+        cw_client.get_boards(msp_custom_domain),
+        return_exceptions=True
+    )
+
+    if isinstance(clients_result, Exception):
+        clients_result = {"success": False, "error": str(clients_result)}
+    if isinstance(boards_result, Exception):
+        boards_result = {"success": False, "error": str(boards_result)}
+
     sync_results["clients_contacts_sync"] = clients_result
-    
+
     if not clients_result.get("success"):
         sync_results["overall_success"] = False
         sync_results["errors"].append("Failed to sync clients and contacts")
-    
-    # Get all boards to sync
-    boards_result = await cw_client.get_boards(msp_custom_domain)
-    
+
     if boards_result.get("success") and boards_result.get("boards"):
         # Prepare board sync requests
         board_configs = []
@@ -601,10 +933,10 @@ async def sync_all_connectwise_data(msp_custom_domain: str) -> Dict[str, Any]:
                 "board_name": board.get("name")
             })
         
-        # Sync all boards
+        # Sync all boards through the shared helper, bypassing the tool layer
         if board_configs:
-            boards_sync_result = await sync_multiple_connectwise_boards(
-                msp_custom_domain, 
+            boards_sync_result = await _sync_boards_impl(
+                msp_custom_domain,
                 board_configs
             )
             sync_results["boards_sync"] = boards_sync_result
@@ -622,9 +954,13 @@ async def sync_all_connectwise_data(msp_custom_domain: str) -> Dict[str, Any]:
 # Add this import after your other client imports
 from app.clients.connectwise_ticketing_client import ConnectWiseTicketingClient
 
+@lru_cache(maxsize=1)
+def _cw_ticketing_client() -> ConnectWiseTicketingClient:
+    return ConnectWiseTicketingClient()
+
 # ========== ConnectWise Ticketing Tools ==========
 
-@mcp.tool
+@mcp_tool
 async def analyze_ticket_request(
     msp_custom_domain: str,
     user_id: str,
@@ -642,10 +978,10 @@ async def analyze_ticket_request(
     Returns:
         Dictionary containing AI-suggested categorization
     """
-    client = ConnectWiseTicketingClient()
+    client = _cw_ticketing_client()
     return await client.get_ticket_categorization(msp_custom_domain, user_id, user_message)
 
-@mcp.tool
+@mcp_tool
 async def get_ticket_diagnostic_questions(
     msp_custom_domain: str,
     user_id: str,
@@ -663,10 +999,10 @@ async def get_ticket_diagnostic_questions(
     Returns:
         Dictionary containing diagnostic Q&A to clarify the issue
     """
-    client = ConnectWiseTicketingClient()
+    client = _cw_ticketing_client()
     return await client.get_ticket_diagnostic_qa(msp_custom_domain, user_id, user_message)
 
-@mcp.tool
+@mcp_tool
 async def create_connectwise_ticket(
     msp_custom_domain: str,
     board_id: int,
@@ -699,29 +1035,27 @@ async def create_connectwise_ticket(
     Returns:
         Dictionary containing created ticket information
     """
-    client = ConnectWiseTicketingClient()
-    
+    client = _cw_ticketing_client()
+
     ticket_details = {
         "boardId": board_id,
         "summary": summary,
         "description": description,
         "companyId": company_id
     }
-    
-    if contact_id:
-        ticket_details["contactId"] = contact_id
-    if priority_id:
-        ticket_details["priorityId"] = priority_id
-    if status_id:
-        ticket_details["statusId"] = status_id
-    if category_id:
-        ticket_details["categoryId"] = category_id
-    if subcategory_id:
-        ticket_details["subcategoryId"] = subcategory_id
-    
+    # Optional fields in a single filtering pass; falsy values stay
+    # omitted so the upstream applies its defaults
+    ticket_details.update({key: value for key, value in (
+        ("contactId", contact_id),
+        ("priorityId", priority_id),
+        ("statusId", status_id),
+        ("categoryId", category_id),
+        ("subcategoryId", subcategory_id)
+    ) if value})
+
     return await client.create_board_ticket(msp_custom_domain, ticket_details, user_id)
 
-@mcp.tool
+@mcp_tool
 async def update_connectwise_ticket(
     msp_custom_domain: str,
     ticket_id: str,
@@ -749,26 +1083,22 @@ async def update_connectwise_ticket(
     Returns:
         Dictionary containing updated ticket information
     """
-    client = ConnectWiseTicketingClient()
-    
-    ticket_details = {}
-    if summary:
-        ticket_details["summary"] = summary
-    if description:
-        ticket_details["description"] = description
-    if priority_id:
-        ticket_details["priorityId"] = priority_id
-    if status_id:
-        ticket_details["statusId"] = status_id
-    if category_id:
-        ticket_details["categoryId"] = category_id
-    if subcategory_id:
-        ticket_details["subcategoryId"] = subcategory_id
-    
+    client = _cw_ticketing_client()
+
+    # Truthiness filter: empty/zero values mean "leave this field alone"
+    ticket_details = {key: value for key, value in (
+        ("summary", summary),
+        ("description", description),
+        ("priorityId", priority_id),
+        ("statusId", status_id),
+        ("categoryId", category_id),
+        ("subcategoryId", subcategory_id)
+    ) if value}
+
     return await client.update_ticket(msp_custom_domain, ticket_id, ticket_details)
 
 
-@mcp.tool
+@mcp_tool
 async def get_connectwise_ticket(
     msp_custom_domain: str,
     ticket_id: str
@@ -783,10 +1113,10 @@ async def get_connectwise_ticket(
     Returns:
         Dictionary containing ticket details
     """
-    client = ConnectWiseTicketingClient()
+    client = _cw_ticketing_client()
     return await client.get_ticket_by_id(msp_custom_domain, ticket_id)
 
-@mcp.tool
+@mcp_tool
 async def get_connectwise_ticket_notes(
     msp_custom_domain: str,
     ticket_id: str,
@@ -803,10 +1133,10 @@ async def get_connectwise_ticket_notes(
     Returns:
         Dictionary containing ticket notes
     """
-    client = ConnectWiseTicketingClient()
+    client = _cw_ticketing_client()
     return await client.get_ticket_notes(msp_custom_domain, ticket_id, detailed)
 
-@mcp.tool
+@mcp_tool
 async def add_note_to_connectwise_ticket(
     msp_custom_domain: str,
     ticket_id: int,
@@ -829,7 +1159,7 @@ async def add_note_to_connectwise_ticket(
     Returns:
         Dictionary containing the created note
     """
-    client = ConnectWiseTicketingClient()
+    client = _cw_ticketing_client()
     
     # Map note type to flags
     detail_description = note_type == "detail"
@@ -845,7 +1175,7 @@ async def add_note_to_connectwise_ticket(
         is_resolution
     )
 
-@mcp.tool
+@mcp_tool
 async def complete_connectwise_ticket(
     msp_custom_domain: str,
     ticket_id: str,
@@ -868,7 +1198,7 @@ async def complete_connectwise_ticket(
     Returns:
         Dictionary indicating success or failure
     """
-    client = ConnectWiseTicketingClient()
+    client = _cw_ticketing_client()
     return await client.complete_ticket(
         msp_custom_domain,
         ticket_id,
@@ -878,7 +1208,7 @@ async def complete_connectwise_ticket(
         final_status
     )
 
-@mcp.tool
+@mcp_tool
 async def create_smart_ticket(
     msp_custom_domain: str,
     user_id: str,
@@ -900,94 +1230,69 @@ async def create_smart_ticket(
     Returns:
         Dictionary containing the created ticket with AI categorization
     """
-    client = ConnectWiseTicketingClient()
-    
-    # First, get AI categorization
-    categorization_result = await client.get_ticket_board_categorization(
-        msp_custom_domain, user_id, issue_description
+    client = _cw_ticketing_client()
+
+    # Categorization and creation run as one fused client operation sharing
+    # a single HTTP connection
+    return await client.categorize_and_create(
+        msp_custom_domain,
+        user_id,
+        issue_description,
+        company_id,
+        contact_id
     )
-    
-    if not categorization_result.get("success"):
-        return categorization_result
-    
-    board_cat = categorization_result["board_categorization"]
-    
-    # Build ticket details from AI suggestions
-    ticket_details = {
-        "boardId": board_cat.get("boardId"),
-        "summary": board_cat.get("summary", issue_description[:100]),
-        "description": issue_description,
-        "companyId": company_id
-    }
-    
-    if contact_id:
-        ticket_details["contactId"] = contact_id
-    
-    # Add AI-suggested categorization if available
-    if board_cat.get("categoryId"):
-        ticket_details["categoryId"] = board_cat["categoryId"]
-    if board_cat.get("subcategoryId"):
-        ticket_details["subcategoryId"] = board_cat["subcategoryId"]
-    if board_cat.get("priorityId"):
-        ticket_details["priorityId"] = board_cat["priorityId"]
-    if board_cat.get("statusId"):
-        ticket_details["statusId"] = board_cat["statusId"]
-    
-    # Create the ticket
-    return await client.create_board_ticket(msp_custom_domain, ticket_details, user_id)
 
 # Add this import after your other client imports
 from app.clients.psa_initialization_client import PSAInitializationClient
 
+@lru_cache(maxsize=1)
+def _psa_init_client() -> PSAInitializationClient:
+    return PSAInitializationClient()
+
 # ========== PSA Generic Tools ==========
 # These tools work across different PSA systems (ConnectWise, Autotask, etc.)
 
-@mcp.tool
-async def get_psa_clients(msp_custom_domain: str) -> Dict[str, Any]:
-    """
-    Get all clients from the PSA system for an MSP domain.
-    This is a generic tool that works with any configured PSA (ConnectWise, Autotask, etc.).
-    
-    Args:
-        msp_custom_domain: The MSP custom domain (e.g., 'etech7')
-        
-    Returns:
-        Dictionary containing list of PSA clients or error information
-    """
-    client = PSAInitializationClient()
-    return await client.get_clients(msp_custom_domain)
-
-@mcp.tool
-async def get_psa_contacts(msp_custom_domain: str) -> Dict[str, Any]:
-    """
-    Get all contacts from the PSA system for an MSP domain.
-    This is a generic tool that works with any configured PSA (ConnectWise, Autotask, etc.).
-    
-    Args:
-        msp_custom_domain: The MSP custom domain (e.g., 'etech7')
-        
-    Returns:
-        Dictionary containing list of PSA contacts or error information
-    """
-    client = PSAInitializationClient()
-    return await client.get_contacts(msp_custom_domain)
-
-@mcp.tool
-async def get_psa_members(msp_custom_domain: str) -> Dict[str, Any]:
-    """
-    Get all members (technicians/employees) from the PSA system for an MSP domain.
-    This is a generic tool that works with any configured PSA (ConnectWise, Autotask, etc.).
-    
-    Args:
-        msp_custom_domain: The MSP custom domain (e.g., 'etech7')
-        
-    Returns:
-        Dictionary containing list of PSA members or error information
-    """
-    client = PSAInitializationClient()
-    return await client.get_members(msp_custom_domain)
+# Maps a normalized entity type to the client method that fetches it and the
+# key under which results appear in the response
+_PSA_ENTITY_DISPATCH = {
+    "clients": ("get_clients", "clients"),
+    "contacts": ("get_contacts", "contacts"),
+    "members": ("get_members", "members")
+}
+
+# Fields considered when searching PSA entities
+_PSA_SEARCH_FIELDS = ("name", "firstName", "lastName", "email", "companyName")
+
+def _entity_searchable(entity: Dict[str, Any]) -> str:
+    """Combine an entity's searchable fields into a single lowercase string."""
+    return " ".join(str(entity.get(field, "")) for field in _PSA_SEARCH_FIELDS).lower()
+
+# (tool name, client method, description, returned data, cache TTL seconds)
+# PSA entity lists churn like their ConnectWise counterparts, so they rely
+# on single-flight coalescing rather than the TTL cache.
+_PSA_SIMPLE_TOOLS = (
+    ("get_psa_clients", "get_clients",
+     "Get all clients from the PSA system for an MSP domain. This is a "
+     "generic tool that works with any configured PSA (ConnectWise, Autotask, etc.).",
+     "list of PSA clients", 0.0),
+    ("get_psa_contacts", "get_contacts",
+     "Get all contacts from the PSA system for an MSP domain. This is a "
+     "generic tool that works with any configured PSA (ConnectWise, Autotask, etc.).",
+     "list of PSA contacts", 0.0),
+    ("get_psa_members", "get_members",
+     "Get all members (technicians/employees) from the PSA system for an "
+     "MSP domain. This is a generic tool that works with any configured "
+     "PSA (ConnectWise, Autotask, etc.).",
+     "list of PSA members", 0.0),
+)
+
+for _name, _method, _description, _returns, _ttl in _PSA_SIMPLE_TOOLS:
+    globals()[_name] = mcp_tool(
+        _make_simple_tool(_name, _psa_init_client, _method, _description, _returns,
+                          cache_ttl=_ttl)
+    )
 
-@mcp.tool
+@mcp_tool
 async def add_psa_contact(
     msp_custom_domain: str,
     first_name: str,
@@ -1015,25 +1320,23 @@ async def add_psa_contact(
     Returns:
         Dictionary containing created contact information or error
     """
-    client = PSAInitializationClient()
-    
+    client = _psa_init_client()
+
     contact_data = {
         "firstName": first_name,
         "lastName": last_name,
         "email": email,
         "psaCompanyId": company_id
     }
-    
-    if phone:
-        contact_data["phone"] = phone
-    if email_type_id:
-        contact_data["emailTypeId"] = email_type_id
-    if phone_type_id:
-        contact_data["phoneTypeId"] = phone_type_id
-    
+    contact_data.update({key: value for key, value in (
+        ("phone", phone),
+        ("emailTypeId", email_type_id),
+        ("phoneTypeId", phone_type_id)
+    ) if value})
+
     return await client.add_contact(msp_custom_domain, contact_data)
 
-@mcp.tool
+@mcp_tool
 async def search_psa_entities(
     msp_custom_domain: str,
     entity_type: str,
@@ -1051,24 +1354,19 @@ async def search_psa_entities(
     Returns:
         Dictionary containing filtered results or all entities if no search term
     """
-    client = PSAInitializationClient()
-    
-    # Get the appropriate entities
-    if entity_type.lower() == "clients":
-        result = await client.get_clients(msp_custom_domain)
-        entity_key = "clients"
-    elif entity_type.lower() == "contacts":
-        result = await client.get_contacts(msp_custom_domain)
-        entity_key = "contacts"
-    elif entity_type.lower() == "members":
-        result = await client.get_members(msp_custom_domain)
-        entity_key = "members"
-    else:
+    client = _psa_init_client()
+
+    # Look up the appropriate fetch method for the entity type
+    dispatch_entry = _PSA_ENTITY_DISPATCH.get(entity_type.lower())
+    if not dispatch_entry:
         return {
             "success": False,
             "error": f"Invalid entity type: {entity_type}",
             "message": "Entity type must be 'clients', 'contacts', or 'members'"
         }
+
+    method_name, entity_key = dispatch_entry
+    result = await getattr(client, method_name)(msp_custom_domain)
     
     if not result.get("success"):
         return result
@@ -1076,19 +1374,17 @@ async def search_psa_entities(
     # Filter results if search term provided
     if search_term and result.get(entity_key):
         search_lower = search_term.lower()
-        filtered = []
-        
-        for entity in result[entity_key]:
-            # Search in common fields
-            if (
-                search_lower in str(entity.get("name", "")).lower() or
-                search_lower in str(entity.get("firstName", "")).lower() or
-                search_lower in str(entity.get("lastName", "")).lower() or
-                search_lower in str(entity.get("email", "")).lower() or
-                search_lower in str(entity.get("companyName", "")).lower()
-            ):
-                filtered.append(entity)
-        
+        search_len = len(search_lower)
+
+        # Build one combined searchable string per entity so each entity is
+        # scanned once instead of once per field; the length check rejects
+        # entities that are too short to match before the substring scan runs
+        filtered = [
+            entity for entity in result[entity_key]
+            if len(searchable := _entity_searchable(entity)) >= search_len
+            and search_lower in searchable
+        ]
+
         result[entity_key] = filtered
         result["filtered"] = True
         result["search_term"] = search_term
@@ -1096,7 +1392,8 @@ async def search_psa_entities(
     
     return result
 
-@mcp.tool
+@mcp_tool
+@singleflight
 async def get_psa_overview(msp_custom_domain: str) -> Dict[str, Any]:
     """
     Get a comprehensive overview of all PSA entities for an MSP domain.
@@ -1108,8 +1405,8 @@ async def get_psa_overview(msp_custom_domain: str) -> Dict[str, Any]:
     Returns:
         Dictionary containing overview of all PSA entities
     """
-    psa_client = PSAInitializationClient()
-    
+    psa_client = _psa_init_client()
+
     overview = {
         "msp_domain": msp_custom_domain,
         "clients": {"count": 0, "status": "pending"},
@@ -1117,67 +1414,61 @@ async def get_psa_overview(msp_custom_domain: str) -> Dict[str, Any]:
         "members": {"count": 0, "status": "pending"},
         "overall_success": True
     }
-    
-    # Get clients
-    clients_result = await psa_client.get_clients(msp_custom_domain)
-    if clients_result.get("success"):
-        overview["clients"]["count"] = len(clients_result.get("clients", []))
-        overview["clients"]["status"] = "success"
-        
-        # Get sample client names (first 5)
-        if clients_result.get("clients"):
-            overview["clients"]["sample"] = [
-                c.get("name", "Unknown") 
-                for c in clients_result["clients"][:5]
-            ]
-    else:
-        overview["clients"]["status"] = "failed"
-        overview["clients"]["error"] = clients_result.get("error")
-        overview["overall_success"] = False
-    
-    # Get contacts
-    contacts_result = await psa_client.get_contacts(msp_custom_domain)
-    if contacts_result.get("success"):
-        overview["contacts"]["count"] = len(contacts_result.get("contacts", []))
-        overview["contacts"]["status"] = "success"
-        
-        # Get sample contact names (first 5)
-        if contacts_result.get("contacts"):
-            overview["contacts"]["sample"] = [
-                f"{c.get('firstName', '')} {c.get('lastName', '')}"
-                for c in contacts_result["contacts"][:5]
-            ]
-    else:
-        overview["contacts"]["status"] = "failed"
-        overview["contacts"]["error"] = contacts_result.get("error")
-        overview["overall_success"] = False
-    
-    # Get members
-    members_result = await psa_client.get_members(msp_custom_domain)
-    if members_result.get("success"):
-        overview["members"]["count"] = len(members_result.get("members", []))
-        overview["members"]["status"] = "success"
-        
-        # Get sample member names (first 5)
-        if members_result.get("members"):
-            overview["members"]["sample"] = [
-                m.get("name", "Unknown")
-                for m in members_result["members"][:5]
-            ]
-    else:
-        overview["members"]["status"] = "failed"
-        overview["members"]["error"] = members_result.get("error")
-        overview["overall_success"] = False
-    
+
+    # The three fetches are independent, so run them concurrently
+    clients_result, contacts_result, members_result = await asyncio.gather(
+        psa_client.get_clients(msp_custom_domain),
+        psa_client.get_contacts(msp_custom_domain),
+        psa_client.get_members(msp_custom_domain)
+    )
+
+    # The three results share the same shape, so fold them in one driven loop.
+    # The name fields describe how sample labels are built for each entity type.
+    spec = [
+        ("clients", clients_result, "name", None),
+        ("contacts", contacts_result, "firstName", "lastName"),
+        ("members", members_result, "name", None)
+    ]
+
+    for key, result, first_field, second_field in spec:
+        section = overview[key]
+
+        if not result.get("success"):
+            section["status"] = "failed"
+            section["error"] = result.get("error")
+            overview["overall_success"] = False
+            continue
+
+        items = result.get(key, [])
+        section["count"] = len(items)
+        section["status"] = "success"
+
+        # Get sample names (first 5)
+        if items:
+            if second_field:
+                section["sample"] = [
+                    f"{item.get(first_field, '')} {item.get(second_field, '')}"
+                    for item in items[:5]
+                ]
+            else:
+                section["sample"] = [
+                    item.get(first_field, "Unknown")
+                    for item in items[:5]
+                ]
+
     return overview
 
 # Add this import after your other client imports
 from app.clients.psa_sync_client import PSASyncClient
 
+@lru_cache(maxsize=1)
+def _psa_sync_client() -> PSASyncClient:
+    return PSASyncClient()
+
 # ========== PSA Sync Tools ==========
 # These tools handle synchronization of PSA data to the local system
 
-@mcp.tool
+@mcp_tool
 async def sync_psa_tickets(msp_custom_domain: str) -> Dict[str, Any]:
     """
     Manually trigger ticket synchronization for a specific MSP domain.
@@ -1191,10 +1482,10 @@ async def sync_psa_tickets(msp_custom_domain: str) -> Dict[str, Any]:
         
     Note: This operation may take some time depending on the number of tickets.
     """
-    client = PSASyncClient()
+    client = _psa_sync_client()
     return await client.sync_tickets_for_domain(msp_custom_domain)
 
-@mcp.tool
+@mcp_tool
 async def sync_all_psa_tickets() -> Dict[str, Any]:
     """
     Manually trigger ticket synchronization for ALL configured MSP domains.
@@ -1206,10 +1497,10 @@ async def sync_all_psa_tickets() -> Dict[str, Any]:
     Warning: This operation may take considerable time if multiple domains are configured.
     Use with caution during business hours.
     """
-    client = PSASyncClient()
+    client = _psa_sync_client()
     return await client.sync_all_domains()
 
-@mcp.tool
+@mcp_tool
 async def sync_psa_with_status_check(
     msp_custom_domain: str,
     check_integration_first: bool = True
@@ -1233,7 +1524,7 @@ async def sync_psa_with_status_check(
     
     # Optionally check if integration exists first
     if check_integration_first:
-        psa_client = PSAInitializationClient()
+        psa_client = _psa_init_client()
         overview = await psa_client.get_clients(msp_custom_domain)
         
         if not overview.get("success"):
@@ -1245,53 +1536,57 @@ async def sync_psa_with_status_check(
         result["integration_check"] = "passed"
     
     # Proceed with sync
-    sync_client = PSASyncClient()
+    sync_client = _psa_sync_client()
     sync_result = await sync_client.sync_tickets_for_domain(msp_custom_domain)
     result["sync_result"] = sync_result
     result["success"] = sync_result.get("success", False)
     
     return result
 
-@mcp.tool
+@mcp_tool
 async def batch_sync_domains(domain_list: List[str]) -> Dict[str, Any]:
     """
-    Sync multiple specific PSA domains in sequence.
+    Sync multiple specific PSA domains concurrently.
     Useful when you want to sync several domains but not all.
-    
+
     Args:
         domain_list: List of MSP custom domains to sync
-        
+
     Returns:
-        Dictionary containing results for each domain
+        Dictionary containing results keyed by domain, regardless of the
+        order in which the syncs finish
         
     Example:
         domain_list = ["etech7", "msp2", "techcorp"]
     """
-    sync_client = PSASyncClient()
+    sync_client = _psa_sync_client()
     results = {
         "total_domains": len(domain_list),
         "successful": 0,
         "failed": 0,
         "domain_results": {}
     }
-    
-    for domain in domain_list:
+
+    async def sync_one(domain: str):
         try:
-            sync_result = await sync_client.sync_tickets_for_domain(domain)
-            results["domain_results"][domain] = sync_result
-            
-            if sync_result.get("success"):
-                results["successful"] += 1
-            else:
-                results["failed"] += 1
-                
+            return domain, await sync_client.sync_tickets_for_domain(domain)
         except Exception as e:
-            results["domain_results"][domain] = {
+            return domain, {
                 "success": False,
                 "error": str(e)
             }
+
+    # Run all domain syncs concurrently and fold each result in as soon as it
+    # completes instead of waiting on the slowest domain
+    for completed in asyncio.as_completed([sync_one(domain) for domain in domain_list]):
+        domain, sync_result = await completed
+        results["domain_results"][domain] = sync_result
+
+        if sync_result.get("success"):
+            results["successful"] += 1
+        else:
             results["failed"] += 1
-    
+
     results["overall_success"] = results["failed"] == 0
     return results
 
@@ -1299,10 +1594,32 @@ async def batch_sync_domains(domain_list: List[str]) -> Dict[str, Any]:
 # Add this import after your other client imports
 from app.clients.psa_ticketing_client import PSATicketingClient
 
+@lru_cache(maxsize=1)
+def _psa_ticketing_client() -> PSATicketingClient:
+    return PSATicketingClient()
+
 # ========== Generic PSA Ticketing Tools ==========
 # These tools work across different PSA systems (ConnectWise, Autotask, etc.)
 
-@mcp.tool
+# Short-lived cache for ticket status polls, keyed by (domain, ticket_id).
+# PSA status changes are not sub-second, so repeated polls within the TTL
+# can be answered from memory instead of hitting the PSA API.
+_TICKET_STATUS_TTL_SECONDS = 10.0
+_ticket_status_cache: Dict[tuple, tuple] = {}
+
+def _invalidate_ticket_status(msp_custom_domain: str, ticket_id: str) -> None:
+    """Drop the cached status for a ticket after an operation that may change it."""
+    _ticket_status_cache.pop((msp_custom_domain, ticket_id), None)
+
+def _gc_ticket_status_cache(now: float) -> None:
+    """Sweep expired entries so the cache does not grow with every
+    distinct ticket ever polled."""
+    expired = [key for key, (expires, _) in _ticket_status_cache.items()
+               if expires <= now]
+    for key in expired:
+        _ticket_status_cache.pop(key, None)
+
+@mcp_tool
 async def get_psa_ticket_diagnostic(
     msp_custom_domain: str,
     user_message: str,
@@ -1329,7 +1646,7 @@ async def get_psa_ticket_diagnostic(
             "message": "Either user_id or tech_id must be provided"
         }
     
-    client = PSATicketingClient()
+    client = _psa_ticketing_client()
     return await client.get_ticket_diagnostic_qa(
         msp_custom_domain, 
         user_message,
@@ -1337,7 +1654,7 @@ async def get_psa_ticket_diagnostic(
         tech_id
     )
 
-@mcp.tool
+@mcp_tool
 async def create_psa_ticket(
     msp_custom_domain: str,
     psa_type: str,
@@ -1379,31 +1696,28 @@ async def create_psa_ticket(
             "message": "If userId is null, techId and psaCompanyId are mandatory"
         }
     
-    client = PSATicketingClient()
-    
+    client = _psa_ticketing_client()
+
     ticket_request = {
         "psaType": psa_type,
         "summary": summary,
         "description": description,
         "boardId": board_id
     }
-    
-    if user_id:
-        ticket_request["userId"] = user_id
-    if tech_id:
-        ticket_request["techId"] = tech_id
-    if psa_company_id:
-        ticket_request["psaCompanyId"] = psa_company_id
-    if priority_id:
-        ticket_request["priorityId"] = priority_id
-    if category_id:
-        ticket_request["categoryId"] = category_id
-    if subcategory_id:
-        ticket_request["subcategoryId"] = subcategory_id
-    
+    # Falsy optionals stay omitted so an empty user_id reads as null
+    # upstream, consistent with the validation above
+    ticket_request.update({key: value for key, value in (
+        ("userId", user_id),
+        ("techId", tech_id),
+        ("psaCompanyId", psa_company_id),
+        ("priorityId", priority_id),
+        ("categoryId", category_id),
+        ("subcategoryId", subcategory_id)
+    ) if value})
+
     return await client.create_ticket(msp_custom_domain, ticket_request)
 
-@mcp.tool
+@mcp_tool
 async def add_psa_ticket_note(
     msp_custom_domain: str,
     ticket_id: str,
@@ -1424,17 +1738,19 @@ async def add_psa_ticket_note(
     Returns:
         Dictionary containing the result of the operation
     """
-    client = PSATicketingClient()
+    client = _psa_ticketing_client()
     
     notes_request = {
         "note": note_text,
         "isInternal": is_internal,
         "isResolution": is_resolution
     }
-    
-    return await client.add_notes_to_ticket(msp_custom_domain, ticket_id, notes_request)
 
-@mcp.tool
+    result = await client.add_notes_to_ticket(msp_custom_domain, ticket_id, notes_request)
+    _invalidate_ticket_status(msp_custom_domain, ticket_id)
+    return result
+
+@mcp_tool
 async def get_psa_ticket_notes(
     msp_custom_domain: str,
     ticket_id: str,
@@ -1451,10 +1767,10 @@ async def get_psa_ticket_notes(
     Returns:
         Dictionary containing ticket notes
     """
-    client = PSATicketingClient()
+    client = _psa_ticketing_client()
     return await client.get_ticket_notes(msp_custom_domain, ticket_id, detailed)
 
-@mcp.tool
+@mcp_tool
 async def close_psa_ticket(
     msp_custom_domain: str,
     ticket_id: str,
@@ -1471,10 +1787,12 @@ async def close_psa_ticket(
     Returns:
         Dictionary containing the result of the operation
     """
-    client = PSATicketingClient()
-    return await client.close_ticket(msp_custom_domain, ticket_id, board_id)
+    client = _psa_ticketing_client()
+    result = await client.close_ticket(msp_custom_domain, ticket_id, board_id)
+    _invalidate_ticket_status(msp_custom_domain, ticket_id)
+    return result
 
-@mcp.tool
+@mcp_tool
 async def get_psa_ticket_status(
     msp_custom_domain: str,
     ticket_id: str
@@ -1489,10 +1807,23 @@ async def get_psa_ticket_status(
     Returns:
         Dictionary containing ticket status information
     """
-    client = PSATicketingClient()
-    return await client.get_ticket_status(msp_custom_domain, ticket_id)
+    cache_key = (msp_custom_domain, ticket_id)
+    now = time.monotonic()
+    cached = _ticket_status_cache.get(cache_key)
+    if cached and cached[0] > now:
+        return cached[1]
+
+    client = _psa_ticketing_client()
+    result = await client.get_ticket_status(msp_custom_domain, ticket_id)
+
+    # Only successful lookups are worth caching
+    if result.get("success"):
+        _gc_ticket_status_cache(now)
+        _ticket_status_cache[cache_key] = (now + _TICKET_STATUS_TTL_SECONDS, result)
 
-@mcp.tool
+    return result
+
+@mcp_tool
 async def create_psa_ticket_with_ai(
     msp_custom_domain: str,
     psa_type: str,
@@ -1524,7 +1855,7 @@ async def create_psa_ticket_with_ai(
             "message": "If userId is null, techId and psaCompanyId are mandatory"
         }
     
-    client = PSATicketingClient()
+    client = _psa_ticketing_client()
     
     # First, get AI diagnostic/categorization
     diagnostic_result = await client.get_ticket_diagnostic_qa(
@@ -1572,10 +1903,23 @@ async def create_psa_ticket_with_ai(
 from app.clients.psa_time_entry_client import PSATimeEntryClient
 from datetime import datetime
 
+@lru_cache(maxsize=1)
+def _time_entry_client() -> PSATimeEntryClient:
+    return PSATimeEntryClient()
+
 # ========== PSA Time Entry Tools ==========
 # These tools handle time tracking across different PSA systems
 
-@mcp.tool
+@lru_cache(maxsize=1)
+def _format_date_for_ordinal(ordinal: int) -> str:
+    """Format a date ordinal as YYYY-MM-DD; cached so the strftime runs once per day."""
+    return datetime.fromordinal(ordinal).strftime("%Y-%m-%d")
+
+def _today_str() -> str:
+    """Get today's date as YYYY-MM-DD, cached until the day rolls over."""
+    return _format_date_for_ordinal(datetime.now().toordinal())
+
+@mcp_tool
 async def create_psa_time_entry(
     msp_custom_domain: str,
     ticket_id: str,
@@ -1607,7 +1951,7 @@ async def create_psa_time_entry(
         Log 2.5 hours of work: time_spent=2.5, time_unit="hours"
         Log 90 minutes of work: time_spent=90, time_unit="minutes"
     """
-    client = PSATimeEntryClient()
+    client = _time_entry_client()
     
     # Convert time to minutes if specified in hours
     time_in_minutes = time_spent
@@ -1627,11 +1971,11 @@ async def create_psa_time_entry(
     if work_date:
         time_entry_request["workDate"] = work_date
     else:
-        time_entry_request["workDate"] = datetime.now().strftime("%Y-%m-%d")
+        time_entry_request["workDate"] = _today_str()
     
     return await client.create_time_entry(time_entry_request)
 
-@mcp.tool
+@mcp_tool
 async def log_quick_time_entry(
     msp_custom_domain: str,
     ticket_id: str,
@@ -1653,7 +1997,7 @@ async def log_quick_time_entry(
     Returns:
         Dictionary containing created time entry information
     """
-    client = PSATimeEntryClient()
+    client = _time_entry_client()
     
     time_entry_request = {
         "mspCustomDomain": msp_custom_domain,
@@ -1662,12 +2006,12 @@ async def log_quick_time_entry(
         "timeSpent": time_minutes,
         "notes": work_description,
         "billable": True,
-        "workDate": datetime.now().strftime("%Y-%m-%d")
+        "workDate": _today_str()
     }
     
     return await client.create_time_entry(time_entry_request)
 
-@mcp.tool
+@mcp_tool
 async def log_bulk_time_entries(
     msp_custom_domain: str,
     technician_id: str,
@@ -1696,50 +2040,57 @@ async def log_bulk_time_entries(
             {"ticket_id": "124", "time_minutes": 60, "notes": "Software installation"}
         ]
     """
-    client = PSATimeEntryClient()
-    results = {
-        "total_entries": len(time_entries),
-        "successful": 0,
-        "failed": 0,
-        "total_minutes_logged": 0,
-        "entries": []
-    }
-    
-    for entry in time_entries:
-        time_entry_request = {
+    client = _time_entry_client()
+    today = _today_str()
+
+    # Build all request dicts up front in a single pass
+    requests = [
+        {
             "mspCustomDomain": msp_custom_domain,
             "ticketId": entry.get("ticket_id"),
             "technicianId": technician_id,
             "timeSpent": entry.get("time_minutes", 0),
             "notes": entry.get("notes", ""),
             "billable": entry.get("billable", True),
-            "workDate": entry.get("work_date", datetime.now().strftime("%Y-%m-%d"))
+            "workDate": entry.get("work_date", today)
         }
-        
-        result = await client.create_time_entry(time_entry_request)
-        
+        for entry in time_entries
+    ]
+
+    entry_results = []
+    for request in requests:
+        result = await client.create_time_entry(request)
+
         entry_result = {
-            "ticket_id": entry.get("ticket_id"),
+            "ticket_id": request["ticketId"],
             "success": result.get("success", False),
-            "minutes": entry.get("time_minutes", 0)
+            "minutes": request["timeSpent"]
         }
-        
+
         if result.get("success"):
-            results["successful"] += 1
-            results["total_minutes_logged"] += entry.get("time_minutes", 0)
             entry_result["time_entry_id"] = result.get("time_entry", {}).get("id")
         else:
-            results["failed"] += 1
             entry_result["error"] = result.get("error", "Unknown error")
-            
-        results["entries"].append(entry_result)
-    
+
+        entry_results.append(entry_result)
+
+    # Aggregate counters in single passes over the collected outcomes
+    successful = sum(1 for r in entry_results if r["success"])
+    total_minutes = sum(r["minutes"] for r in entry_results if r["success"])
+
+    results = {
+        "total_entries": len(time_entries),
+        "successful": successful,
+        "failed": len(entry_results) - successful,
+        "total_minutes_logged": total_minutes,
+        "entries": entry_results
+    }
     results["overall_success"] = results["failed"] == 0
-    results["total_hours_logged"] = round(results["total_minutes_logged"] / 60, 2)
-    
+    results["total_hours_logged"] = round(total_minutes / 60, 2)
+
     return results
 
-@mcp.tool
+@mcp_tool
 async def check_psa_time_entry_health() -> Dict[str, Any]:
     """
     Check the health status of the PSA time entry service.
@@ -1748,10 +2099,10 @@ async def check_psa_time_entry_health() -> Dict[str, Any]:
     Returns:
         Dictionary containing service health information
     """
-    client = PSATimeEntryClient()
+    client = _time_entry_client()
     return await client.check_service_health()
 
-@mcp.tool
+@mcp_tool
 async def log_time_with_completion(
     msp_custom_domain: str,
     ticket_id: str,
@@ -1784,7 +2135,7 @@ async def log_time_with_completion(
     }
     
     # First, create time entry
-    time_client = PSATimeEntryClient()
+    time_client = _time_entry_client()
     time_entry_request = {
         "mspCustomDomain": msp_custom_domain,
         "ticketId": ticket_id,
@@ -1792,7 +2143,7 @@ async def log_time_with_completion(
         "timeSpent": time_minutes,
         "notes": resolution_notes,
         "billable": True,
-        "workDate": datetime.now().strftime("%Y-%m-%d")
+        "workDate": _today_str()
     }
     
     time_result = await time_client.create_time_entry(time_entry_request)
@@ -1804,7 +2155,7 @@ async def log_time_with_completion(
     
     # Optionally close the ticket
     if close_ticket:
-        psa_client = PSATicketingClient()
+        psa_client = _psa_ticketing_client()
         close_result = await psa_client.close_ticket(
             msp_custom_domain, 
             ticket_id, 
@@ -1818,6 +2169,320 @@ async def log_time_with_completion(
     return results
 
 
+# ========== Meta Tools ==========
+
+# batch_execute parses its nested call list itself, so it gets a msgspec
+# Struct schema: one C-level pass validates every entry before any task
+# is spawned. Falls back to permissive dict handling without msgspec.
+try:
+    import msgspec
+
+    class _BatchCall(msgspec.Struct, frozen=True):
+        """Shape of one batch_execute entry."""
+        tool: str
+        args: Dict[str, Any] = msgspec.field(default_factory=dict)
+        timeout_ms: Optional[int] = None
+except ImportError:
+    msgspec = None
+    _BatchCall = None
+
+
+@mcp_tool
+async def batch_execute(
+    calls: List[Dict[str, Any]],
+    max_concurrent: int = 8,
+    stop_on_error: bool = False
+) -> Dict[str, Any]:
+    """
+    Execute several tool calls in a single request.
+    The calls are dispatched concurrently in-process, so N independent
+    lookups cost one MCP round-trip instead of N.
+
+    Args:
+        calls: List of calls to execute, each containing:
+            - tool: Name of the tool to invoke
+            - args: Dictionary of arguments for the tool (optional)
+            - timeout_ms: Optional per-call timeout in milliseconds
+        max_concurrent: Maximum number of calls running at once (default: 8)
+        stop_on_error: If True, cancel calls still pending after a failure
+
+    Returns:
+        Dictionary containing per-call results in request order
+
+    Example:
+        calls = [
+            {"tool": "get_autotask_statuses", "args": {"msp_custom_domain": "etech7"}},
+            {"tool": "get_autotask_priorities", "args": {"msp_custom_domain": "etech7"}}
+        ]
+    """
+    # max_concurrent is caller-controlled: zero would make every worker
+    # block on the semaphore forever and a negative value raises out of
+    # the tool body, so reject both up front
+    if max_concurrent < 1:
+        return {
+            "total_calls": len(calls),
+            "successful": 0,
+            "failed": len(calls),
+            "results": [],
+            "overall_success": False,
+            "error": f"max_concurrent must be >= 1, got {max_concurrent}"
+        }
+
+    if _BatchCall is not None:
+        try:
+            parsed = msgspec.convert(calls, type=List[_BatchCall])
+        except msgspec.ValidationError as e:
+            return {
+                "total_calls": len(calls),
+                "successful": 0,
+                "failed": len(calls),
+                "results": [],
+                "overall_success": False,
+                "error": f"Invalid calls: {e}"
+            }
+        calls = [
+            {"tool": c.tool, "args": c.args, "timeout_ms": c.timeout_ms}
+            for c in parsed
+        ]
+
+    semaphore = asyncio.Semaphore(max_concurrent)
+    failed = asyncio.Event()
+
+    async def run_one(index: int, call: Dict[str, Any]) -> Dict[str, Any]:
+        tool_name = call.get("tool")
+        tool_fn = _TOOL_REGISTRY.get(tool_name)
+
+        if tool_fn is None:
+            failed.set()
+            return {
+                "index": index,
+                "ok": False,
+                "error": f"Unknown tool: {tool_name}"
+            }
+
+        async with semaphore:
+            if stop_on_error and failed.is_set():
+                return {
+                    "index": index,
+                    "ok": False,
+                    "error": "Skipped after earlier failure"
+                }
+
+            timeout_ms = call.get("timeout_ms")
+            try:
+                coro = tool_fn(**call.get("args", {}))
+                if timeout_ms:
+                    result = await asyncio.wait_for(coro, timeout=timeout_ms / 1000)
+                else:
+                    result = await coro
+                return {"index": index, "ok": True, "result": result}
+            except asyncio.TimeoutError:
+                # str(TimeoutError()) is empty, so spell the failure out
+                failed.set()
+                return {
+                    "index": index,
+                    "ok": False,
+                    "error": f"Timed out after {timeout_ms}ms"
+                }
+            except Exception as e:
+                failed.set()
+                return {"index": index, "ok": False, "error": str(e)}
+
+    tasks = [asyncio.create_task(run_one(index, call))
+             for index, call in enumerate(calls)]
+
+    watcher = None
+    if stop_on_error:
+        # The moment any call fails, cancel everything still pending
+        # instead of letting queued work drain through the semaphore
+        async def _cancel_pending():
+            await failed.wait()
+            for task in tasks:
+                task.cancel()
+
+        watcher = asyncio.create_task(_cancel_pending())
+
+    outcomes = await asyncio.gather(*tasks, return_exceptions=True)
+    if watcher is not None:
+        watcher.cancel()
+
+    # Outcomes arrive in task order, so results stay in request order
+    call_results = []
+    for index, outcome in enumerate(outcomes):
+        if isinstance(outcome, asyncio.CancelledError):
+            call_results.append({
+                "index": index,
+                "ok": False,
+                "error": "Cancelled after earlier failure"
+            })
+        elif isinstance(outcome, BaseException):
+            call_results.append({
+                "index": index,
+                "ok": False,
+                "error": str(outcome)
+            })
+        else:
+            call_results.append(outcome)
+
+    successful = sum(1 for r in call_results if r["ok"])
+    return {
+        "total_calls": len(calls),
+        "successful": successful,
+        "failed": len(calls) - successful,
+        "results": call_results,
+        "overall_success": successful == len(calls)
+    }
+
+
+# ========== Background Jobs ==========
+
+# Slow operations can run as background jobs so the tool call returns
+# immediately instead of risking an MCP client timeout. Finished jobs
+# stay pollable for this long before being garbage-collected.
+_JOB_RETENTION_SECONDS = 600.0
+_JOBS: Dict[str, Dict[str, Any]] = {}
+
+def _gc_jobs() -> None:
+    """Drop jobs that finished more than the retention window ago."""
+    now = time.monotonic()
+    for job_id, job in list(_JOBS.items()):
+        if not job["task"].done():
+            continue
+        if "done_at" not in job:
+            job["done_at"] = now
+        elif now - job["done_at"] > _JOB_RETENTION_SECONDS:
+            _JOBS.pop(job_id, None)
+
+def _start_job(kind: str, coro) -> Dict[str, Any]:
+    """Launch a coroutine as a background job and return its handle."""
+    _gc_jobs()
+    job_id = f"{kind}-{uuid.uuid4().hex[:12]}"
+    _JOBS[job_id] = {"task": asyncio.create_task(coro)}
+    return {
+        "success": True,
+        "job_id": job_id,
+        "status": "running"
+    }
+
+@mcp_tool
+async def create_weaviate_schema_job() -> Dict[str, Any]:
+    """
+    Start Weaviate schema creation as a background job.
+    Returns immediately with a job_id; check progress with poll_job.
+    The synchronous create_weaviate_schema tool remains available.
+
+    Returns:
+        Dictionary with the job_id and initial status
+    """
+    client = _weaviate_client()
+    return _start_job("create-weaviate-schema", client.create_schema())
+
+@mcp_tool
+async def create_connectwise_board_job(msp_custom_domain: str, board_name: str, board_type: str = "Service") -> Dict[str, Any]:
+    """
+    Start ConnectWise board creation as a background job.
+    Returns immediately with a job_id; check progress with poll_job.
+    The synchronous create_connectwise_board tool remains available.
+
+    Args:
+        msp_custom_domain: The MSP custom domain (e.g., 'etech7')
+        board_name: Name for the new board
+        board_type: Type of board (default: "Service")
+
+    Returns:
+        Dictionary with the job_id and initial status
+    """
+    client = _connectwise_client()
+    board_request = {
+        "name": board_name,
+        "type": board_type
+    }
+    return _start_job(
+        "create-connectwise-board",
+        client.create_board(board_request, msp_custom_domain)
+    )
+
+@mcp_tool
+async def poll_job(job_id: str) -> Dict[str, Any]:
+    """
+    Check the status of a background job.
+
+    Args:
+        job_id: Job identifier returned by one of the *_job tools
+
+    Returns:
+        Dictionary with the job status and, once done, its result
+    """
+    _gc_jobs()
+    job = _JOBS.get(job_id)
+    if job is None:
+        return {
+            "success": False,
+            "error": f"Unknown job: {job_id}"
+        }
+
+    task = job["task"]
+    if not task.done():
+        return {"success": True, "job_id": job_id, "status": "running"}
+    if task.cancelled():
+        return {"success": False, "job_id": job_id, "status": "cancelled"}
+    if task.exception() is not None:
+        return {
+            "success": False,
+            "job_id": job_id,
+            "status": "failed",
+            "error": str(task.exception())
+        }
+    return {
+        "success": True,
+        "job_id": job_id,
+        "status": "done",
+        "result": task.result()
+    }
+
+
+@mcp_tool
+async def get_tool_latency_stats() -> Dict[str, Any]:
+    """
+    Report per-tool call latency statistics for this server process.
+
+    Returns:
+        Dictionary keyed by tool name with call count, average and max
+        latency in milliseconds, and histogram bucket counts
+    """
+    return {
+        tool_name: {
+            "count": stats["count"],
+            "avg_ms": round(stats["total_ms"] / stats["count"], 2),
+            "max_ms": round(stats["max_ms"], 2),
+            "histogram": dict(zip(_LATENCY_BUCKET_LABELS, stats["buckets"]))
+        }
+        for tool_name, stats in sorted(_latency_stats.items())
+    }
+
+
+async def _prebuild_tool_schemas() -> None:
+    """Force FastMCP to build every tool schema before serving.
+
+    get_tools() is the public accessor and materializes each tool's
+    parameter schema, so the first list_tools request returns cached
+    schemas instead of building 60+ of them serially. Guarded so an
+    API change degrades to a no-op instead of breaking startup.
+    """
+    get_tools = getattr(mcp, "get_tools", None)
+    if get_tools is None:
+        return
+    tools = get_tools()
+    if asyncio.iscoroutine(tools):
+        tools = await tools
+    for tool in (tools or {}).values():
+        dump = getattr(tool, "model_dump", None)
+        if callable(dump):
+            dump()
+
 # Run the server
 if __name__ == "__main__":
+    # Load environment variables once at process start. The clients are lazy
+    # singletons, so they resolve env on first use rather than at import.
+    load_dotenv(override=False)
     mcp.run()
\ No newline at end of file
@@ -1,4 +1,5 @@
 import asyncio
+import pathlib
 import sys
 from mcp import ClientSession, StdioServerParameters
 from mcp.client.stdio import stdio_client
@@ -8,48 +9,41 @@ async def main():
     server_params = StdioServerParameters(
         command="python",
         args=["server.py"],
-        cwd=r"C:\Users\sahaj\simple-mcp-server"
+        cwd=pathlib.Path(__file__).parent
     )
-    
+
     # Create and connect client
     async with stdio_client(server_params) as (read, write):
         async with ClientSession(read, write) as session:
             # Initialize the session
             await session.initialize()
-            
+
             # List available tools
             tools = await session.list_tools()
             print("Available tools:")
             for tool in tools.tools:
                 print(f"  - {tool.name}: {tool.description}")
-            
+
             # Call the get_tickets_by_domain tool
             result = await session.call_tool(
                 "get_tickets_by_domain",
                 arguments={"domain": "etech7"}
             )
-            
+
             print("\nTickets found:")
             for ticket in result.content:
                 # result.content is already a list of dicts after the fix
                 print(ticket)
 
-        # After listing tools, test the new Weaviate tools
-        print("\n--- Testing Weaviate Tools ---")
-
-        # Test connection
-        connection_result = await session.call_tool(
-            "test_weaviate_connection",
-            arguments={}
-        )
-        print(f"Connection test: {connection_result.content}")
-
-        # Check schema
-        schema_result = await session.call_tool(
-            "check_weaviate_schema",
-            arguments={}
-        )
-        print(f"Schema check: {schema_result.content}")
+            # Test the Weaviate tools; the two checks are independent,
+            # so run them concurrently
+            print("\n--- Testing Weaviate Tools ---")
+            connection_result, schema_result = await asyncio.gather(
+                session.call_tool("test_weaviate_connection", arguments={}),
+                session.call_tool("check_weaviate_schema", arguments={})
+            )
+            print(f"Connection test: {connection_result.content}")
+            print(f"Schema check: {schema_result.content}")
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    asyncio.run(main())